@@ -1,28 +1,80 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
-from datetime import datetime
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import yaml  # type: ignore
 except Exception:
     yaml = None
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+_YAML_OK = yaml is not None
+
+if _YAML_OK:
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    _YAML_STREAMS = _YAML_DUMPER is not yaml.SafeDumper
+    _YAML_READER_ERROR = yaml.reader.ReaderError
+
+    def _yaml_load(source):
+        return yaml.load(source, Loader=_YAML_LOADER)
+
+    def _yaml_dump(data, stream=None) -> bytes | None:
+        return yaml.dump(data, stream, Dumper=_YAML_DUMPER, sort_keys=False, allow_unicode=True, encoding="utf-8")
+
+else:
+    _YAML_STREAMS = False
+    _YAML_READER_ERROR = ()
+
+    def _yaml_load(source):
+        raise RuntimeError("pyyaml not available")
+
+    def _yaml_dump(data, stream=None) -> bytes | None:
+        raise RuntimeError("pyyaml not available")
+
 BACKUP_EXT = ".jonmem"
-ALLOWED_BACKUP_EXTS = (BACKUP_EXT, ".yaml", ".yml")
+YAML_BACKUP_EXTS = (".yaml", ".yml")
+ALLOWED_BACKUP_EXTS = (BACKUP_EXT, *YAML_BACKUP_EXTS)
+_BACKUP_EXT_SET = frozenset(ALLOWED_BACKUP_EXTS)
+_YAML_EXT_SET = frozenset(YAML_BACKUP_EXTS)
+_VOCAB_KEYS = frozenset(("meta", "topics", "cards"))
+_PAYLOAD_KEYS = frozenset(("meta", "vocab", "progress", "training_log", "exam_log"))
+_EMPTY_OBJ = b"{}"
+_EMPTY_LIST = b"[]"
+_YAML_PAYLOAD_CACHE: dict[tuple[str, int, int], dict] = {}
+_YAML_PAYLOAD_CACHE_SIZE = 16
+
+
+def has_backup_extension(path: str) -> bool:
+    tail = path.rpartition(".")[2]
+    return len(tail) < len(path) and f".{tail}".lower() in _BACKUP_EXT_SET
+
+
+def is_yaml_backup_path(path: str | None) -> bool:
+    if not path:
+        return False
+    tail = path.rpartition(".")[2]
+    return len(tail) < len(path) and f".{tail}".lower() in _YAML_EXT_SET
 
 
 def ensure_backup_extension(path: str) -> str:
-    lower = path.lower()
-    if lower.endswith(ALLOWED_BACKUP_EXTS):
+    if has_backup_extension(path):
         return path
     return f"{path}{BACKUP_EXT}"
 
 
 def build_backup_payload(vocab: dict, progress: dict, training_log: list, exam_log: list) -> dict:
     return {
-        "meta": {"created": datetime.now().isoformat(timespec="seconds")},
+        "meta": {"created": time.strftime("%Y-%m-%dT%H:%M:%S")},
         "vocab": vocab,
         "progress": progress,
         "training_log": training_log,
@@ -57,6 +109,9 @@ def normalize_backup_payload(data: dict) -> dict:
     if not isinstance(exam_log, list):
         raise ValueError("invalid exam log")
 
+    if vocab.keys() == _VOCAB_KEYS and meta is vocab["meta"] and data.keys() == _PAYLOAD_KEYS:
+        return data
+
     return {
         "meta": data.get("meta", {}),
         "vocab": {"meta": meta, "topics": topics, "cards": cards},
@@ -67,71 +122,249 @@ def normalize_backup_payload(data: dict) -> dict:
 
 
 def scan_backup_payload(payload: dict) -> dict:
-    vocab = payload.get("vocab", {}) if isinstance(payload, dict) else {}
-    topics = vocab.get("topics", []) if isinstance(vocab, dict) else []
-    cards = vocab.get("cards", []) if isinstance(vocab, dict) else []
-    meta = vocab.get("meta", {}) if isinstance(vocab, dict) else {}
+    return scan_backup_payload_normalized(normalize_backup_payload(payload))
+
+
+def scan_backup_payload_normalized(payload: dict) -> dict:
+    vocab = payload["vocab"]
+    topics = vocab["topics"]
+    cards = vocab["cards"]
+    target_langs = vocab["meta"].get("target_langs")
 
-    langs = set()
-    target_langs = meta.get("target_langs") if isinstance(meta, dict) else None
     if isinstance(target_langs, str):
-        langs.add(target_langs)
+        langs = {target_langs}
     elif isinstance(target_langs, list):
-        for lang in target_langs:
-            if lang:
-                langs.add(str(lang))
-
-    for topic in topics if isinstance(topics, list) else []:
-        if isinstance(topic, dict):
-            lang = topic.get("lang")
-            if lang:
-                langs.add(str(lang))
-
-    for card in cards if isinstance(cards, list) else []:
-        if isinstance(card, dict):
-            lang = card.get("lang")
-            if lang:
-                langs.add(str(lang))
+        langs = {lang if type(lang) is str else str(lang) for lang in target_langs if lang}
+    else:
+        langs = set()
+    for items in (topics, cards):
+        langs.update({
+            lang if type(lang) is str else str(lang)
+            for item in items
+            if type(item) is dict and (lang := item.get("lang"))
+        })
 
     return {
         "languages": sorted(langs),
         "language_count": len(langs),
-        "topic_count": len(topics) if isinstance(topics, list) else 0,
-        "card_count": len(cards) if isinstance(cards, list) else 0,
+        "topic_count": len(topics),
+        "card_count": len(cards),
     }
 
 
-def dump_payload_to_yaml_bytes(payload: dict) -> bytes:
-    if yaml is None:
-        raise RuntimeError("pyyaml not available")
-    text = yaml.safe_dump(payload, sort_keys=False, allow_unicode=True)
-    return text.encode("utf-8")
-
-
-def load_payload_from_yaml_bytes(raw: bytes) -> dict:
-    if yaml is None:
-        raise RuntimeError("pyyaml not available")
-    data = yaml.safe_load(raw.decode("utf-8", errors="replace")) or {}
+def apply_vocab_journal(vocab: dict, entries: list) -> int:
+    topics = vocab.setdefault("topics", [])
+    cards = vocab.setdefault("cards", [])
+    applied = 0
+    for entry in entries:
+        if type(entry) is not dict:
+            continue
+        op = entry.get("op")
+        if op == "card":
+            card = entry.get("card")
+            if not isinstance(card, dict) or not card.get("id"):
+                continue
+            for idx, existing in enumerate(cards):
+                if existing.get("id") == card["id"]:
+                    cards[idx] = card
+                    break
+            else:
+                cards.append(card)
+        elif op == "delete":
+            card_id = entry.get("id")
+            cards[:] = [card for card in cards if card.get("id") != card_id]
+        elif op == "topic":
+            topic = entry.get("topic")
+            if not isinstance(topic, dict):
+                continue
+            key = (topic.get("lang", "en"), topic.get("id"))
+            if any((item.get("lang", "en"), item.get("id")) == key for item in topics):
+                continue
+            topics.append(topic)
+        elif op == "meta":
+            meta = entry.get("meta")
+            if not isinstance(meta, dict):
+                continue
+            vocab["meta"] = meta
+        else:
+            continue
+        applied += 1
+    return applied
+
+
+def _dump_json_bytes(data, *, indent: bool = False) -> bytes:
+    if not data:
+        if type(data) is dict:
+            return _EMPTY_OBJ
+        if type(data) is list:
+            return _EMPTY_LIST
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _load_json_bytes(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _is_jsonl_path(path: str | None) -> bool:
+    return bool(path) and path.lower().endswith(".jsonl")
+
+
+def _dump_jsonl_bytes(items: list) -> bytes:
+    return b"".join(_dump_json_bytes(item) + b"\n" for item in items)
+
+
+def _load_jsonl_bytes(raw: bytes) -> list:
+    items = []
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        try:
+            items.append(_load_json_bytes(line))
+        except ValueError:
+            continue
+    return items
+
+
+def _load_yaml_bytes(raw: bytes):
+    try:
+        return _yaml_load(raw)
+    except _YAML_READER_ERROR:
+        return _yaml_load(raw.decode("utf-8", errors="replace"))
+
+
+def dump_payload_bytes(payload: dict, path: str | None = None) -> bytes:
+    if is_yaml_backup_path(path):
+        return _yaml_dump(payload)
+    return _dump_json_bytes(payload)
+
+
+def write_payload(handle, payload: dict, path: str | None = None) -> None:
+    if is_yaml_backup_path(path):
+        # The pure-Python dumper issues one write per token; buffer it and write once.
+        if _YAML_STREAMS:
+            _yaml_dump(payload, handle)
+        else:
+            handle.write(_yaml_dump(payload))
+    else:
+        handle.write(_dump_json_bytes(payload))
+
+
+def _looks_like_json(raw: bytes) -> bool:
+    return raw.lstrip()[:1] == b"{"
+
+
+def load_payload_bytes(raw: bytes) -> dict:
+    data = None
+    if _looks_like_json(raw):
+        try:
+            data = _load_json_bytes(raw)
+        except ValueError:
+            data = None
+    if data is None:
+        data = _load_yaml_bytes(raw) or {}
     if not isinstance(data, dict):
-        raise ValueError("invalid yaml structure")
+        raise ValueError("invalid backup structure")
     return data
 
 
 def load_payload_from_path(path: str) -> dict:
-    if yaml is None:
-        raise RuntimeError("pyyaml not available")
-    with open(path, "r", encoding="utf-8", errors="replace") as handle:
-        data = yaml.safe_load(handle) or {}
-    if not isinstance(data, dict):
-        raise ValueError("invalid yaml structure")
-    return data
+    path = os.fspath(path)
+    with open(path, "rb") as handle:
+        stat = os.fstat(handle.fileno())
+        raw = handle.read()
+    if _looks_like_json(raw):
+        return load_payload_bytes(raw)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    data = _YAML_PAYLOAD_CACHE.get(key)
+    if data is None:
+        data = load_payload_bytes(raw)
+        if len(_YAML_PAYLOAD_CACHE) >= _YAML_PAYLOAD_CACHE_SIZE:
+            _YAML_PAYLOAD_CACHE.pop(next(iter(_YAML_PAYLOAD_CACHE)))
+        _YAML_PAYLOAD_CACHE[key] = data
+    return copy.deepcopy(data)
+
+
+def _atomic_write(path: str, write) -> None:
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as handle:
+            write(handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_bytes_atomic(path: str, data: bytes) -> None:
+    _atomic_write(path, lambda handle: handle.write(data))
+
+
+def copy_file_atomic(src: str, dst: str) -> None:
+    tmp_path = f"{dst}.tmp-{os.getpid()}"
+    try:
+        shutil.copyfile(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save_json_file(path: str, data) -> None:
+    write_bytes_atomic(path, _dump_json_bytes(data))
+
+
+def save_jsonl_file(path: str, items: list) -> None:
+    write_bytes_atomic(path, _dump_jsonl_bytes(items))
+
+
+def append_jsonl(path: str, item) -> None:
+    with open(path, "ab") as handle:
+        handle.write(_dump_json_bytes(item) + b"\n")
+
+
+def load_jsonl_file(path: str, default):
+    try:
+        return _read_jsonl_file(path)
+    except FileNotFoundError:
+        return default
+
+
+def _write_bytes_if_changed(path: str, data: bytes) -> None:
+    try:
+        if os.stat(path).st_size == len(data):
+            with open(path, "rb") as handle:
+                if handle.read() == data:
+                    return
+    except OSError:
+        pass
+    write_bytes_atomic(path, data)
 
 
 def persist_payload_to_file(path: str, payload: dict) -> None:
-    if yaml is None:
-        raise RuntimeError("pyyaml not available")
-    with open(path, "w", encoding="utf-8") as handle:
-        yaml.safe_dump(payload, handle, sort_keys=False, allow_unicode=True)
+    _atomic_write(path, lambda handle: write_payload(handle, payload, path))
+
+
+def _dump_log_bytes(items: list, path: str) -> bytes:
+    if _is_jsonl_path(path):
+        return _dump_jsonl_bytes(items)
+    return _dump_json_bytes(items, indent=True)
 
 
 def persist_payload_to_files(
@@ -143,33 +376,39 @@ def persist_payload_to_files(
     exam_log_path: str,
     fail_after: str | None = None,
 ) -> None:
-    if yaml is None:
-        raise RuntimeError("pyyaml not available")
     vocab = payload.get("vocab", {})
-    progress = payload.get("progress", {})
-    training_log = payload.get("training_log", [])
-    exam_log = payload.get("exam_log", [])
+    files = (
+        ("vocab", vocab_path, _yaml_dump(vocab) if is_yaml_backup_path(vocab_path) else _dump_json_bytes(vocab)),
+        ("progress", progress_path, _dump_json_bytes(payload.get("progress", {}), indent=True)),
+        ("training_log", training_log_path, _dump_log_bytes(payload.get("training_log", []), training_log_path)),
+        ("exam_log", exam_log_path, _dump_json_bytes(payload.get("exam_log", []), indent=True)),
+    )
 
     os.makedirs(os.path.dirname(vocab_path), exist_ok=True)
-    with open(vocab_path, "w", encoding="utf-8") as handle:
-        yaml.safe_dump(vocab, handle, sort_keys=False, allow_unicode=True)
-    if fail_after == "vocab":
-        raise RuntimeError("simulated failure after vocab")
+    if fail_after is None:
+        with ThreadPoolExecutor(max_workers=len(files)) as pool:
+            list(pool.map(lambda item: _write_bytes_if_changed(item[1], item[2]), files))
+        return
 
-    with open(progress_path, "w", encoding="utf-8") as handle:
-        json.dump(progress, handle, ensure_ascii=False, indent=2)
-    if fail_after == "progress":
-        raise RuntimeError("simulated failure after progress")
+    for name, path, data in files:
+        _write_bytes_if_changed(path, data)
+        if fail_after == name:
+            raise RuntimeError(f"simulated failure after {name}")
 
-    with open(training_log_path, "w", encoding="utf-8") as handle:
-        json.dump(training_log, handle, ensure_ascii=False, indent=2)
-    if fail_after == "training_log":
-        raise RuntimeError("simulated failure after training_log")
 
-    with open(exam_log_path, "w", encoding="utf-8") as handle:
-        json.dump(exam_log, handle, ensure_ascii=False, indent=2)
-    if fail_after == "exam_log":
-        raise RuntimeError("simulated failure after exam_log")
+def _read_yaml_file(path: str):
+    with open(path, "rb") as handle:
+        return _load_yaml_bytes(handle.read())
+
+
+def _read_json_file(path: str):
+    with open(path, "rb") as handle:
+        return _load_json_bytes(handle.read())
+
+
+def _read_jsonl_file(path: str) -> list:
+    with open(path, "rb") as handle:
+        return _load_jsonl_bytes(handle.read())
 
 
 def load_payload_from_files(
@@ -179,19 +418,16 @@ def load_payload_from_files(
     training_log_path: str,
     exam_log_path: str,
 ) -> dict:
-    if yaml is None:
-        raise RuntimeError("pyyaml not available")
-    with open(vocab_path, "r", encoding="utf-8", errors="replace") as handle:
-        vocab = yaml.safe_load(handle) or {}
-    with open(progress_path, "r", encoding="utf-8", errors="replace") as handle:
-        progress = json.load(handle)
-    with open(training_log_path, "r", encoding="utf-8", errors="replace") as handle:
-        training_log = json.load(handle)
-    with open(exam_log_path, "r", encoding="utf-8", errors="replace") as handle:
-        exam_log = json.load(handle)
+    read_vocab = _read_yaml_file if is_yaml_backup_path(vocab_path) else _read_json_file
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        vocab = pool.submit(read_vocab, vocab_path)
+        progress = pool.submit(_read_json_file, progress_path)
+        training_log = pool.submit(_read_jsonl_file if _is_jsonl_path(training_log_path) else _read_json_file,
+                                   training_log_path)
+        exam_log = pool.submit(_read_json_file, exam_log_path)
     return {
-        "vocab": vocab,
-        "progress": progress,
-        "training_log": training_log,
-        "exam_log": exam_log,
+        "vocab": vocab.result() or {},
+        "progress": progress.result(),
+        "training_log": training_log.result(),
+        "exam_log": exam_log.result(),
     }
@@ -3,15 +3,17 @@
 
 from __future__ import annotations
 
-import calendar
+import copy
 import json
-import math
+import mmap
 import os
 import random
-import struct
+import tempfile
+import threading
 import traceback
-import wave
+from collections import deque
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 
 import backup_io
 
@@ -31,9 +33,11 @@ from kivy.core.text import LabelBase
 from kivy.core.window import Window
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
-from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
 from kivy.uix.popup import Popup
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.uix.screenmanager import ScreenManager, Screen
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.spinner import Spinner, SpinnerOption
@@ -48,11 +52,20 @@ try:
 except Exception:
     yaml = None
 
+if yaml is not None:
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 try:
     from plyer import notification  # type: ignore
 except Exception:
     notification = None
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
 __version__ = "0.7"
 
 
@@ -62,15 +75,29 @@ ANDROID_EXPORT_REQUEST = 41001
 ANDROID_IMPORT_REQUEST = 41002
 ANDROID_TREE_REQUEST = 41003
 NOTIFICATION_PERMISSION_REQUEST = 1001
+ANDROID_READ_CHUNK = 64 * 1024
 NOTIFICATION_CHANNEL_ID = "trainer"
 
-SEED_VOCAB_PATH = os.path.join(os.path.dirname(__file__), "data", "seed_vocab.yaml")
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SEED_VOCAB_PATH = os.path.join(_APP_DIR, "data", "seed_vocab.yaml")
+SOUNDS_DIR = os.path.join(_APP_DIR, "data", "sounds")
 
 SESSION_MAX_ITEMS = 10
 SESSION_SECONDS = 300
 EXAM_SECONDS_PER_CARD = 30
 MAX_STAGE = 4
 INTRODUCE_REPEAT_COUNT = 2
+SAVE_DEBOUNCE_SECONDS = 0.5
+PROGRESS_SAVE_DEBOUNCE_SECONDS = 2.0
+CARD_FORM_FIELDS = [
+    ("Deutsch", "de"),
+    ("Zielsprache", "en"),
+    ("Eselsbrücke DE → EN", "hint_de_to_en"),
+    ("Eselsbrücke EN → DE", "hint_en_to_de"),
+]
+CARD_FORM_KEYS = tuple(key for _label, key in CARD_FORM_FIELDS)
+_EMPTY = training.EMPTY
+_APOSTROPHES = frozenset(("'", "’", "´"))
 PYRAMID_STAGE_WEIGHTS = {
     1: 4,
     2: 3,
@@ -83,7 +110,7 @@ ARROW_LEFT_ICON = "\u25C0"
 ARROW_RIGHT_ICON = "\u25B6"
 STAR_ICON = "\u2605"
 MOON_ICON = "\u263E"
-FONT_PATH = os.path.join(os.path.dirname(__file__), "data", "fonts", "DejaVuSans.ttf")
+FONT_PATH = os.path.join(_APP_DIR, "data", "fonts", "DejaVuSans.ttf")
 APP_FONT_NAME = None
 
 SUPPORT_URL = "https://www.paypal.com/donate/?hosted_button_id=PND6Y8CGNZVW6"
@@ -133,22 +160,45 @@ Diese Lizenz erlaubt es Ihnen, die Software frei zu nutzen, zu studieren, zu ver
 Weitere Details finden Sie unter https://dfsl.de
 """
 
-try:
-    from plyer import filechooser  # type: ignore
-except Exception:
-    filechooser = None
+@lru_cache(maxsize=1)
+def _load_filechooser():
+    try:
+        from plyer import filechooser  # type: ignore
+    except Exception:
+        return None
+    return filechooser
+
+
+_UI_SCALE_CACHE: float | None = None
+_SCALE_MEMO: dict[float, float] = {}
 
 
 def _ui_scale() -> float:
-    short_edge = min(Window.width or 0, Window.height or 0)
-    if short_edge <= 0:
-        return 1.0
-    scale = short_edge / 720.0
-    return max(0.85, min(1.6, scale))
+    global _UI_SCALE_CACHE
+    if _UI_SCALE_CACHE is None:
+        short_edge = min(Window.width or 0, Window.height or 0)
+        if short_edge <= 0:
+            return 1.0
+        _UI_SCALE_CACHE = max(0.85, min(1.6, short_edge / 720.0))
+    return _UI_SCALE_CACHE
 
 
 def _ui(value: float) -> float:
-    return max(1.0, value * _ui_scale())
+    scaled = _SCALE_MEMO.get(value)
+    if scaled is None:
+        scaled = max(1.0, value * _ui_scale())
+        if _UI_SCALE_CACHE is not None:
+            _SCALE_MEMO[value] = scaled
+    return scaled
+
+
+def _invalidate_ui_scale(*_) -> None:
+    global _UI_SCALE_CACHE
+    _UI_SCALE_CACHE = None
+    _SCALE_MEMO.clear()
+
+
+Window.bind(on_resize=_invalidate_ui_scale)
 
 
 def _scroll_to_widget(widget) -> None:
@@ -195,6 +245,18 @@ def _styled_spinner(**kwargs) -> Spinner:
         kwargs.setdefault("font_name", APP_FONT_NAME)
     return Spinner(**kwargs)
 
+def _label_size_cb(label, *_) -> None:
+    label.text_size = (label.width, None)
+
+
+def _label_fill_cb(label, size) -> None:
+    label.text_size = size
+
+
+def _label_texture_cb(label, size) -> None:
+    label.height = size[1] + _ui(6)
+
+
 def _styled_label(text: str, **kwargs) -> Label:
     kwargs.setdefault("font_size", _ui(BASE_LABEL_FONT_SIZE))
     kwargs.setdefault("color", TEXT_COLOR)
@@ -202,11 +264,26 @@ def _styled_label(text: str, **kwargs) -> Label:
         kwargs.setdefault("font_name", APP_FONT_NAME)
     label = Label(text=text, **kwargs)
     label.size_hint_y = None
-    label.bind(size=lambda lbl, *_: setattr(lbl, "text_size", (lbl.width, None)))
-    label.bind(texture_size=lambda lbl, size: setattr(lbl, "height", size[1] + _ui(6)))
+    label.bind(size=_label_size_cb, texture_size=_label_texture_cb)
     return label
 
 
+def _card_hint_text(item: dict) -> str:
+    lines = []
+    if hint_de := item.get("hint_de_to_en"):
+        lines.append(f"Eselsbrücke DE → ZS: {hint_de}")
+    if hint_en := item.get("hint_en_to_de"):
+        lines.append(f"Eselsbrücke ZS → DE: {hint_en}")
+    return "\n".join(lines)
+
+
+def _set_label_visible(label: Label, visible: bool, text: str = "") -> None:
+    label.text = text if visible else ""
+    label.opacity = 1 if visible else 0
+    if label.size_hint_y is not None:
+        label.size_hint_y = 1 if visible else 0
+
+
 def _make_scrollable(container: BoxLayout) -> ScrollView:
     container.size_hint_y = None
     container.bind(minimum_height=container.setter("height"))
@@ -221,14 +298,74 @@ def _styled_popup(**kwargs) -> Popup:
     kwargs.setdefault("separator_color", CARD_BORDER)
     return Popup(**kwargs)
 
+
+def _build_form_popup(title: str, fields: list[tuple[str, str]], submit_text: str, on_submit,
+                      values: dict | None = None, size_hint=(0.9, 0.5), spacing: float = 8) -> tuple[Popup, dict]:
+    values = values or {}
+    box = BoxLayout(orientation="vertical", spacing=_ui(spacing), padding=_ui(8))
+    inputs = {}
+    for label, key in fields:
+        box.add_widget(_styled_label(label))
+        inputs[key] = _styled_text_input(multiline=False, text=values.get(key) or "",
+                                         size_hint_y=None, height=_ui(BASE_INPUT_HEIGHT))
+        box.add_widget(inputs[key])
+    btn_row = BoxLayout(size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT), spacing=_ui(8))
+    btn_row.add_widget(Button(text=submit_text, on_release=lambda *_: on_submit(inputs)))
+    btn_row.add_widget(Button(text="Abbrechen", on_release=lambda *_: popup.dismiss()))
+    box.add_widget(btn_row)
+    popup = _styled_popup(title=title, content=_make_scrollable(box), size_hint=size_hint)
+    return popup, inputs
+
+
+_LEVEL_BG_COLORS = (CARD_BG, LEVEL_BG_2, LEVEL_BG_3, LEVEL_BG_4)
+
+
 def _level_bg_color(level: int) -> tuple[float, float, float, float]:
-    if level == 2:
-        return LEVEL_BG_2
-    if level == 3:
-        return LEVEL_BG_3
-    if level >= 4:
-        return LEVEL_BG_4
-    return CARD_BG
+    return _LEVEL_BG_COLORS[min(max(level, 1), 4) - 1]
+
+
+def _add_training_count(counts: dict, entry) -> None:
+    try:
+        day = entry.get("started", "")[:10]
+    except Exception:
+        return
+    if not day:
+        return
+    day_entry = counts.setdefault(day, {"introduce": 0, "review": 0})
+    day_entry["introduce" if entry.get("mode") == "introduce" else "review"] += 1
+
+
+def _card_to_item(card: dict, de_to_en: bool, stage: int = 1) -> dict:
+    g = card.get
+    de = g("de")
+    en = g("en")
+    hint_de = g("hint_de_to_en")
+    hint_en = g("hint_en_to_de")
+    return {
+        "id": g("id"),
+        "prompt": de if de_to_en else en,
+        "answer": en if de_to_en else de,
+        "hint": hint_de if de_to_en else hint_en,
+        "de": "" if de is None else de,
+        "en": "" if en is None else en,
+        "hint_de_to_en": "" if hint_de is None else hint_de,
+        "hint_en_to_de": "" if hint_en is None else hint_en,
+        "mnemonic": g("mnemonic", ""),
+        "stage": stage,
+        "topic": g("topic"),
+        "lang": g("lang", "en"),
+        "answer_prepared": None,
+    }
+
+
+def _cards_to_items(cards: list[dict], direction: str, progress: dict) -> list[dict]:
+    de_to_en = direction == "de_to_en"
+    items = []
+    append = items.append
+    for card in cards:
+        prog = progress.get(card.get("id", ""), _EMPTY).get(direction)
+        append(_card_to_item(card, de_to_en, 1 if prog is None else int(prog.get("stage", 1))))
+    return items
 
 
 def _read_text(path: str) -> str:
@@ -244,76 +381,75 @@ def _read_bytes(path: str) -> bytes:
 def _load_yaml(path: str) -> dict:
     if yaml is None:
         raise RuntimeError("pyyaml not available")
-    with open(path, "r", encoding="utf-8", errors="replace") as handle:
-        data = yaml.safe_load(handle) or {}
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return {}
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            try:
+                data = yaml.load(mapped, Loader=_YAML_LOADER) or {}
+            except yaml.reader.ReaderError:
+                data = yaml.load(mapped[:].decode("utf-8", errors="replace"), Loader=_YAML_LOADER) or {}
     if not isinstance(data, dict):
         raise ValueError("invalid yaml structure")
     return data
 
 
-def _save_yaml(path: str, data: dict) -> None:
-    if yaml is None:
-        raise RuntimeError("pyyaml not available")
-    with open(path, "w", encoding="utf-8") as handle:
-        yaml.safe_dump(data, handle, sort_keys=False, allow_unicode=True)
-
-
-def _dump_yaml_bytes(data: dict) -> bytes:
-    if yaml is None:
-        raise RuntimeError("pyyaml not available")
-    text = yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
-    return text.encode("utf-8")
+def _fresh_yaml_cache(path: str) -> str | None:
+    cache_path = f"{path}.json"
+    try:
+        if os.stat(cache_path).st_mtime_ns >= os.stat(path).st_mtime_ns:
+            return cache_path
+    except OSError:
+        pass
+    return None
 
 
-def _load_yaml_bytes(raw: bytes) -> dict:
-    if yaml is None:
-        raise RuntimeError("pyyaml not available")
-    data = yaml.safe_load(raw.decode("utf-8", errors="replace")) or {}
-    if not isinstance(data, dict):
-        raise ValueError("invalid yaml structure")
-    return data
+def _load_yaml_cached(path: str) -> dict:
+    cache_path = _fresh_yaml_cache(path)
+    if cache_path is not None:
+        try:
+            data = _load_json(cache_path, None)
+            if isinstance(data, dict):
+                return data
+        except ValueError:
+            pass
+    return _load_yaml(path)
 
 
 def _load_json(path: str, default):
-    if not os.path.exists(path):
+    try:
+        if orjson is not None:
+            with open(path, "rb") as handle:
+                return orjson.loads(handle.read())
+        with open(path, "r", encoding="utf-8", errors="replace") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
         return default
-    with open(path, "r", encoding="utf-8", errors="replace") as handle:
-        return json.load(handle)
 
-def _save_json(path: str, data) -> None:
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(data, handle, ensure_ascii=False, indent=2)
+
+_SLUG_TABLE = training.CharFilter(str.isalnum, {ord(" "): "_", ord("-"): "_", ord("_"): "_"})
 
 
+@lru_cache(maxsize=512)
 def _slugify(text: str) -> str:
-    out = []
-    for ch in text.lower():
-        if ch.isalnum():
-            out.append(ch)
-        elif ch in (" ", "-", "_"):
-            out.append("_")
-    slug = "".join(out).strip("_")
+    slug = text.lower().translate(_SLUG_TABLE).strip("_")
     return slug or "topic"
 
 
+_CONTENT_URI_PREFIX = "content://"
+_FILE_URI_PREFIX = "file://"
+
+
 def _is_content_uri(path: str) -> bool:
-    return isinstance(path, str) and path.startswith("content://")
+    return isinstance(path, str) and path.startswith(_CONTENT_URI_PREFIX)
 
 
 def _normalize_path(path: str) -> str:
-    if isinstance(path, str) and path.startswith("file://"):
-        return path[7:]
+    if isinstance(path, str):
+        return path.removeprefix(_FILE_URI_PREFIX)
     return path
 
 
-def _ensure_yaml_extension(path: str) -> str:
-    if _is_content_uri(path):
-        return path
-    if path.lower().endswith((".yaml", ".yml")):
-        return path
-    return f"{path}.yaml"
-
-
 def _ensure_backup_extension(path: str) -> str:
     if _is_content_uri(path):
         return path
@@ -368,6 +504,13 @@ def _tk_save_file(title: str, initial_dir: str, default_name: str) -> str | None
     return path or None
 
 
+def _jbytes_to_bytes(data) -> bytes:
+    to_bytes = getattr(data, "tostring", None)
+    if to_bytes is not None:
+        return to_bytes()
+    return bytes(data)
+
+
 def _android_read_uri(uri: str) -> bytes:
     if not IS_ANDROID:
         raise RuntimeError("android uri read not available")
@@ -379,30 +522,33 @@ def _android_read_uri(uri: str) -> bytes:
     stream = resolver.openInputStream(juri)
     if stream is None:
         raise RuntimeError("unable to open input stream")
-    ByteArrayOutputStream = autoclass("java.io.ByteArrayOutputStream")
-    baos = ByteArrayOutputStream()
     try:
-        try:
-            from jnius import jarray  # type: ignore
-            buffer = jarray("b")(4096)
-            while True:
-                count = stream.read(buffer)
-                if count == -1:
-                    break
-                baos.write(buffer, 0, count)
-        except Exception:
-            while True:
-                byte_val = stream.read()
-                if byte_val == -1:
-                    break
-                baos.write(byte_val)
+        if hasattr(stream, "readAllBytes"):
+            data = stream.readAllBytes()
+        else:
+            ByteArrayOutputStream = autoclass("java.io.ByteArrayOutputStream")
+            baos = ByteArrayOutputStream(max(stream.available(), ANDROID_READ_CHUNK))
+            try:
+                from jnius import jarray  # type: ignore
+                buffer = jarray("b")(ANDROID_READ_CHUNK)
+                while True:
+                    count = stream.read(buffer)
+                    if count == -1:
+                        break
+                    baos.write(buffer, 0, count)
+            except Exception:
+                while True:
+                    byte_val = stream.read()
+                    if byte_val == -1:
+                        break
+                    baos.write(byte_val)
+            data = baos.toByteArray()
     finally:
         stream.close()
-    data = baos.toByteArray()
-    return bytes(data)
+    return _jbytes_to_bytes(data)
 
 
-def _android_write_uri(uri: str, data: bytes) -> None:
+def _android_write_uri(uri: str, data) -> None:
     if not IS_ANDROID:
         raise RuntimeError("android uri write not available")
     from jnius import autoclass  # type: ignore
@@ -414,32 +560,26 @@ def _android_write_uri(uri: str, data: bytes) -> None:
     if stream is None:
         raise RuntimeError("unable to open output stream")
     try:
-        try:
-            from jnius import jarray  # type: ignore
-            stream.write(jarray("b")(data))
-        except Exception:
-            try:
-                stream.write(data)
-            except Exception:
-                for byte_val in data:
-                    stream.write(byte_val)
+        if isinstance(data, (bytes, bytearray)):
+            _android_write_chunk(stream, data)
+        else:
+            while chunk := data.read(ANDROID_READ_CHUNK):
+                _android_write_chunk(stream, chunk)
         stream.flush()
     finally:
         stream.close()
 
 
-def _ensure_beep(path: str, *, freq: float = 880.0, duration: float = 0.12) -> None:
-    if os.path.exists(path):
-        return
-    framerate = 44100
-    samples = int(framerate * duration)
-    with wave.open(path, "w") as wav:
-        wav.setnchannels(1)
-        wav.setsampwidth(2)
-        wav.setframerate(framerate)
-        for i in range(samples):
-            val = int(32767 * 0.5 * math.sin(2 * math.pi * freq * (i / framerate)))
-            wav.writeframes(struct.pack("<h", val))
+def _android_write_chunk(stream, data: bytes) -> None:
+    try:
+        from jnius import jarray  # type: ignore
+        stream.write(jarray("b")(data))
+    except Exception:
+        try:
+            stream.write(data)
+        except Exception:
+            for byte_val in data:
+                stream.write(byte_val)
 
 
 class TopBar(BoxLayout):
@@ -458,7 +598,15 @@ class TopBar(BoxLayout):
         self.add_widget(Label(text=title, font_size=_ui(BASE_LABEL_FONT_SIZE + 4), color=TEXT_COLOR))
 
 
-class CardRow(BoxLayout):
+class AutoTextSizeBoxLayout(BoxLayout):
+    def do_layout(self, *largs):
+        super().do_layout(*largs)
+        for child in self.children:
+            if type(child) is Label:
+                child.text_size = child.size
+
+
+class CardRow(AutoTextSizeBoxLayout):
     def __init__(self, text: str, **kwargs):
         super().__init__(orientation="vertical", size_hint_y=None, height=_ui(BASE_CARD_HEIGHT), padding=10, **kwargs)
         with self.canvas.before:
@@ -467,10 +615,8 @@ class CardRow(BoxLayout):
             Color(*CARD_BORDER)
             self._border = Line(rounded_rectangle=[self.x, self.y, self.width, self.height, 10])
         self.bind(pos=self._update_canvas, size=self._update_canvas)
-        label = Label(text=text, halign="left", valign="middle",
-                      font_size=_ui(BASE_LABEL_FONT_SIZE), color=TEXT_COLOR)
-        label.bind(size=lambda lbl, *_: setattr(lbl, "text_size", lbl.size))
-        self.add_widget(label)
+        self.add_widget(Label(text=text, halign="left", valign="middle",
+                              font_size=_ui(BASE_LABEL_FONT_SIZE), color=TEXT_COLOR))
 
     def _update_canvas(self, *_):
         self._bg.pos = self.pos
@@ -478,18 +624,32 @@ class CardRow(BoxLayout):
         self._border.rounded_rectangle = [self.x, self.y, self.width, self.height, 10]
 
 
-class VocabRow(BoxLayout):
-    def __init__(self, card: dict, on_edit, on_delete, **kwargs):
+class VocabRow(RecycleDataViewBehavior, AutoTextSizeBoxLayout):
+    def __init__(self, **kwargs):
         super().__init__(orientation="horizontal", size_hint_y=None, height=_ui(BASE_CARD_HEIGHT),
                          padding=6, spacing=6, **kwargs)
-        label = Label(text=f"{card.get('de', '')} — {card.get('en', '')}",
-                      halign="left", valign="middle", font_size=_ui(BASE_LABEL_FONT_SIZE), color=TEXT_COLOR)
-        label.bind(size=lambda lbl, *_: setattr(lbl, "text_size", lbl.size))
-        self.add_widget(label)
-        self.add_widget(Button(text="Bearbeiten", size_hint_x=None, width=_ui(160),
-                               on_release=lambda *_: on_edit(card)))
-        self.add_widget(Button(text="Löschen", size_hint_x=None, width=_ui(130),
-                               on_release=lambda *_: on_delete(card)))
+        self.card = None
+        self._on_edit = None
+        self._on_delete = None
+        self.label = Label(halign="left", valign="middle", font_size=_ui(BASE_LABEL_FONT_SIZE), color=TEXT_COLOR)
+        self.add_widget(self.label)
+        self.add_widget(Button(text="Bearbeiten", size_hint_x=None, width=_ui(160), on_release=self._edit))
+        self.add_widget(Button(text="Löschen", size_hint_x=None, width=_ui(130), on_release=self._delete))
+
+    def refresh_view_attrs(self, rv, index, data):
+        card = data["card"]
+        self.card = card
+        self._on_edit = data["on_edit"]
+        self._on_delete = data["on_delete"]
+        self.label.text = f"{card.get('de', '')} — {card.get('en', '')}"
+
+    def _edit(self, *_):
+        if self.card is not None:
+            self._on_edit(self.card)
+
+    def _delete(self, *_):
+        if self.card is not None:
+            self._on_delete(self.card)
 
 
 class CalendarCell(BoxLayout):
@@ -500,8 +660,14 @@ class CalendarCell(BoxLayout):
         if APP_FONT_NAME:
             day_kwargs["font_name"] = APP_FONT_NAME
             count_kwargs["font_name"] = APP_FONT_NAME
-        self.add_widget(Label(**day_kwargs))
-        self.add_widget(Label(**count_kwargs))
+        self.day_label = Label(**day_kwargs)
+        self.count_label = Label(**count_kwargs)
+        self.add_widget(self.day_label)
+        self.add_widget(self.count_label)
+
+    def set_values(self, day_text: str, count_text: str) -> None:
+        self.day_label.text = day_text
+        self.count_label.text = count_text
 
 
 class MenuScreen(Screen):
@@ -510,9 +676,9 @@ class MenuScreen(Screen):
         layout = BoxLayout(orientation="vertical")
         layout.add_widget(TopBar(app, "JonMem"))
         body = BoxLayout(orientation="vertical", padding=16, spacing=12)
-        body.add_widget(Button(text="Training starten", on_release=lambda *_: app.show_training_setup()))
-        body.add_widget(Button(text="Vokabeln eingeben", on_release=lambda *_: app.show_vocab()))
-        body.add_widget(Button(text="Kalender", on_release=lambda *_: app.show_calendar()))
+        body.add_widget(Button(text="Training starten", on_release=app.show_training_setup))
+        body.add_widget(Button(text="Vokabeln eingeben", on_release=app.show_vocab))
+        body.add_widget(Button(text="Kalender", on_release=app.show_calendar))
         layout.add_widget(body)
         self.add_widget(layout)
 
@@ -526,13 +692,13 @@ class TrainingSetupScreen(Screen):
         body = BoxLayout(orientation="vertical", padding=_ui(16), spacing=_ui(12))
         body.add_widget(_styled_label("Modus"))
         btn_row = BoxLayout(size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT), spacing=_ui(8))
-        btn_row.add_widget(Button(text="Einführen", on_release=lambda *_: self._start("introduce")))
-        btn_row.add_widget(Button(text="Wiederholen", on_release=lambda *_: self._start("review")))
-        btn_row.add_widget(Button(text="Prüfung", on_release=lambda *_: self._start("exam")))
+        btn_row.add_widget(Button(text="Einführen", on_release=partial(self._start, "introduce")))
+        btn_row.add_widget(Button(text="Wiederholen", on_release=partial(self._start, "review")))
+        btn_row.add_widget(Button(text="Prüfung", on_release=partial(self._start, "exam")))
         body.add_widget(btn_row)
         body.add_widget(_styled_label("Sprache"))
         self.lang_spinner = _styled_spinner(text="", values=[], size_hint_y=None, height=_ui(BASE_INPUT_HEIGHT))
-        self.lang_spinner.bind(text=lambda _spinner, text: self._set_lang(text))
+        self.lang_spinner.bind(text=self._on_lang_text)
         body.add_widget(self.lang_spinner)
         self.lang_label = _styled_label("")
         body.add_widget(self.lang_label)
@@ -540,21 +706,21 @@ class TrainingSetupScreen(Screen):
         dir_row = BoxLayout(size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT), spacing=_ui(8))
         self.dir_de = ToggleButton(text="DE → EN", group="direction", state="down")
         self.dir_en = ToggleButton(text="EN → DE", group="direction")
-        self.dir_de.bind(state=lambda btn, state: self._toggle_dir(btn, state, "de_to_en"))
-        self.dir_en.bind(state=lambda btn, state: self._toggle_dir(btn, state, "en_to_de"))
+        self.dir_de.bind(state=partial(self._toggle_dir, "de_to_en"))
+        self.dir_en.bind(state=partial(self._toggle_dir, "en_to_de"))
         dir_row.add_widget(self.dir_de)
         dir_row.add_widget(self.dir_en)
         body.add_widget(dir_row)
         self.dir_label = _styled_label("Aktuell: DE → EN")
         body.add_widget(self.dir_label)
         body.add_widget(Button(text="Zurück", size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT),
-                               on_release=lambda *_: self.app.show_menu()))
+                               on_release=self.app.show_menu))
         layout.add_widget(body)
         self.add_widget(layout)
         self._direction = "de_to_en"
         self._lang = ""
 
-    def _toggle_dir(self, _btn, state: str, direction: str) -> None:
+    def _toggle_dir(self, direction: str, _btn, state: str) -> None:
         if state == "down":
             self._set_dir(direction)
 
@@ -562,7 +728,7 @@ class TrainingSetupScreen(Screen):
         self._direction = direction
         self._update_direction_labels()
 
-    def _start(self, mode: str) -> None:
+    def _start(self, mode: str, *_) -> None:
         lang = self._lang or (self.lang_spinner.text or "").strip()
         if mode == "introduce":
             self.app.show_intro_category_picker(lang, self._direction)
@@ -590,6 +756,9 @@ class TrainingSetupScreen(Screen):
             self.lang_spinner.text = ""
             self._set_lang("")
 
+    def _on_lang_text(self, _spinner, text: str) -> None:
+        self._set_lang(text)
+
     def _set_lang(self, lang: str) -> None:
         self._lang = (lang or "").strip()
         if self._lang:
@@ -636,7 +805,7 @@ class TrainingScreen(Screen):
             self.prompt_label.font_name = APP_FONT_NAME
         self.prompt_label.size_hint_y = None
         self.prompt_label.height = _ui(120)
-        self.prompt_label.bind(size=lambda lbl, *_: setattr(lbl, "text_size", lbl.size))
+        self.prompt_label.bind(size=_label_fill_cb)
         self.card_box.add_widget(self.prompt_label)
 
         info_row = BoxLayout(orientation="horizontal", spacing=_ui(8), size_hint_y=None)
@@ -693,6 +862,7 @@ class VocabScreen(Screen):
         self.selected_lang = ""
         self.selected_topic = ""
         self.selected_topic_id = ""
+        self._refresh_cards_trigger = Clock.create_trigger(self._populate_cards)
 
         layout = BoxLayout(orientation="vertical")
         layout.add_widget(TopBar(app, "Vokabeln"))
@@ -749,11 +919,13 @@ class VocabScreen(Screen):
         body = BoxLayout(orientation="vertical", padding=_ui(16), spacing=_ui(12))
         self.topic_label = _styled_label("")
         body.add_widget(self.topic_label)
-        self.cards_layout = BoxLayout(orientation="vertical", spacing=6, size_hint_y=None)
-        self.cards_layout.bind(minimum_height=self.cards_layout.setter("height"))
-        cards_scroll = ScrollView(size_hint=(1, 1))
-        cards_scroll.add_widget(self.cards_layout)
-        body.add_widget(cards_scroll)
+        self.cards_view = RecycleView(size_hint=(1, 1), do_scroll_x=False)
+        self.cards_view.viewclass = VocabRow
+        cards_layout = RecycleBoxLayout(orientation="vertical", spacing=6, size_hint_y=None,
+                                        default_size=(None, _ui(BASE_CARD_HEIGHT)), default_size_hint=(1, None))
+        cards_layout.bind(minimum_height=cards_layout.setter("height"))
+        self.cards_view.add_widget(cards_layout)
+        body.add_widget(self.cards_view)
         btn_row = BoxLayout(size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT), spacing=_ui(8))
         btn_row.add_widget(Button(text="Neu", on_release=lambda *_: self._open_card_editor()))
         btn_row.add_widget(Button(text="Zurück", on_release=lambda *_: self._go_step("vocab_topic")))
@@ -787,9 +959,13 @@ class VocabScreen(Screen):
             self.topic_spinner.text = ""
 
     def _refresh_cards(self) -> None:
-        self.cards_layout.clear_widgets()
-        for card in self.app.get_cards_for_topic(self.selected_lang, self.selected_topic):
-            self.cards_layout.add_widget(VocabRow(card, self._open_card_editor, self._confirm_delete))
+        self._refresh_cards_trigger()
+
+    def _populate_cards(self, *_) -> None:
+        self.cards_view.data = [
+            {"card": card, "on_edit": self._open_card_editor, "on_delete": self._confirm_delete}
+            for card in self.app.get_cards_for_topic(self.selected_lang, self.selected_topic)
+        ]
 
     def _select_language(self) -> None:
         new_lang = self.new_lang_input.text.strip()
@@ -820,31 +996,9 @@ class VocabScreen(Screen):
 
     def _open_card_editor(self, card: dict | None = None) -> None:
         title = "Vokabel bearbeiten" if card else "Neue Vokabel"
-        box = BoxLayout(orientation="vertical", spacing=_ui(8), padding=_ui(8))
-        box.add_widget(_styled_label("Deutsch"))
-        de_input = _styled_text_input(multiline=False, size_hint_y=None, height=_ui(BASE_INPUT_HEIGHT))
-        box.add_widget(de_input)
-        box.add_widget(_styled_label("Zielsprache"))
-        en_input = _styled_text_input(multiline=False, size_hint_y=None, height=_ui(BASE_INPUT_HEIGHT))
-        box.add_widget(en_input)
-        box.add_widget(_styled_label("Eselsbrücke DE → EN"))
-        hint_de_input = _styled_text_input(multiline=False, size_hint_y=None, height=_ui(BASE_INPUT_HEIGHT))
-        box.add_widget(hint_de_input)
-        box.add_widget(_styled_label("Eselsbrücke EN → DE"))
-        hint_en_input = _styled_text_input(multiline=False, size_hint_y=None, height=_ui(BASE_INPUT_HEIGHT))
-        box.add_widget(hint_en_input)
-
-        if card:
-            de_input.text = card.get("de", "")
-            en_input.text = card.get("en", "")
-            hint_de_input.text = card.get("hint_de_to_en", "")
-            hint_en_input.text = card.get("hint_en_to_de", "")
 
-        def do_save(_):
-            de = de_input.text.strip()
-            en = en_input.text.strip()
-            hint_de = hint_de_input.text.strip()
-            hint_en = hint_en_input.text.strip()
+        def do_save(inputs):
+            de, en, hint_de, hint_en = (inputs[key].text.strip() for key in CARD_FORM_KEYS)
             if not de or not en:
                 _styled_popup(title="Vokabeln", content=Label(text="Deutsch und Zielsprache müssen gesetzt sein."),
                               size_hint=(0.7, 0.3)).open()
@@ -857,11 +1011,8 @@ class VocabScreen(Screen):
             popup.dismiss()
             self._refresh_cards()
 
-        btn_row = BoxLayout(size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT), spacing=_ui(8))
-        btn_row.add_widget(Button(text="Speichern", on_release=do_save))
-        btn_row.add_widget(Button(text="Abbrechen", on_release=lambda *_: popup.dismiss()))
-        box.add_widget(btn_row)
-        popup = _styled_popup(title=title, content=_make_scrollable(box), size_hint=(0.95, 0.9))
+        popup, _inputs = _build_form_popup(title, CARD_FORM_FIELDS, "Speichern", do_save,
+                                           values=card, size_hint=(0.95, 0.9))
         popup.open()
 
     def _confirm_delete(self, card: dict) -> None:
@@ -900,15 +1051,20 @@ class CalendarScreen(Screen):
             self.month_label.font_name = APP_FONT_NAME
         self.month_label.halign = "center"
         self.month_label.valign = "middle"
-        self.month_label.bind(size=lambda lbl, *_: setattr(lbl, "text_size", lbl.size))
+        self.month_label.bind(size=_label_fill_cb)
         month_header.add_widget(prev_btn)
         month_header.add_widget(self.month_label)
         month_header.add_widget(next_btn)
         self.body.add_widget(month_header)
+        from kivy.uix.gridlayout import GridLayout
         self.header_grid = GridLayout(cols=7, spacing=_ui(4), size_hint_y=None, height=_ui(24))
         self.grid = GridLayout(cols=7, spacing=4, size_hint_y=None, row_force_default=True,
                                row_default_height=_ui(BASE_CALENDAR_CELL_HEIGHT))
         self.grid.bind(minimum_height=self.grid.setter("height"))
+        for wd in ("Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"):
+            self.header_grid.add_widget(Label(text=wd, bold=True, font_size=_ui(BASE_LABEL_FONT_SIZE), color=TEXT_COLOR))
+        self._cells = [CalendarCell("", "") for _ in range(42)]
+        self._last_month_key = None
         self.body.add_widget(self.header_grid)
         scroll = ScrollView()
         scroll.add_widget(self.grid)
@@ -931,21 +1087,27 @@ class CalendarScreen(Screen):
         self._build_month()
 
     def _build_month(self):
-        self.grid.clear_widgets()
-        self.header_grid.clear_widgets()
-        self.exam_list.clear_widgets()
         month = self.current_month or datetime.now()
+        training_log = self.app.training_log
+        exam_log = self.app.exam_log
+        key = (month.year, month.month, id(training_log), len(training_log), id(exam_log), len(exam_log))
+        if key == self._last_month_key:
+            return
+        self._last_month_key = key
+        self.exam_list.clear_widgets()
         self.month_label.text = month.strftime("%B %Y")
         counts = self.app.training_counts_by_day()
 
-        weekdays = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
-        for wd in weekdays:
-            self.header_grid.add_widget(Label(text=wd, bold=True, font_size=_ui(BASE_LABEL_FONT_SIZE), color=TEXT_COLOR))
-
-        cal = calendar.Calendar(firstweekday=0)
-        for day in cal.itermonthdates(month.year, month.month):
+        import calendar
+        days = list(calendar.Calendar(firstweekday=0).itermonthdates(month.year, month.month))
+        shown = len(self.grid.children)
+        for cell in self._cells[len(days):shown]:
+            self.grid.remove_widget(cell)
+        for cell in self._cells[shown:len(days)]:
+            self.grid.add_widget(cell)
+        for cell, day in zip(self._cells, days):
             if day.month != month.month:
-                self.grid.add_widget(CalendarCell("", ""))
+                cell.set_values("", "")
                 continue
             key = day.isoformat()
             day_counts = counts.get(key, {"introduce": 0, "review": 0})
@@ -956,8 +1118,7 @@ class CalendarScreen(Screen):
                 parts.append(f"{MOON_ICON}{introduce_count}")
             if review_count > 0:
                 parts.append(f"{STAR_ICON}{review_count}")
-            count_text = " ".join(parts)
-            self.grid.add_widget(CalendarCell(str(day.day), count_text))
+            cell.set_values(str(day.day), " ".join(parts))
         exams = self.app.get_exam_results_for_month(month.year, month.month)
         if not exams:
             self.exam_list.add_widget(_styled_label("Keine Prüfungen in diesem Monat."))
@@ -983,11 +1144,22 @@ class CalendarScreen(Screen):
 
 
 class JonMemApp(App):
+    _LAZY_SCREENS = {
+        "setup": ("screen_setup", TrainingSetupScreen),
+        "train": ("screen_train", TrainingScreen),
+        "vocab": ("screen_vocab", VocabScreen),
+        "calendar": ("screen_calendar", CalendarScreen),
+    }
+
     def build(self):
         global APP_FONT_NAME
         self.title = "JonMem"
         self._error_log = []
         self._last_exception = ""
+        self._pending_saves = set()
+        self._focus_redraw_trigger = Clock.create_trigger(self._apply_redraw, 0.05)
+        self._save_trigger = Clock.create_trigger(self._flush_pending_saves, SAVE_DEBOUNCE_SECONDS)
+        self._progress_save_trigger = Clock.create_trigger(self._flush_pending_saves, PROGRESS_SAVE_DEBOUNCE_SECONDS)
         self._android_activity_bound = False
         self._android_export_pending_path = None
         self._android_import_pending = False
@@ -1016,36 +1188,43 @@ class JonMemApp(App):
 
         self.data_dir = self.user_data_dir
         os.makedirs(self.data_dir, exist_ok=True)
-        self.vocab_path = os.path.join(self.data_dir, "vocab.yaml")
+        self.vocab_path = os.path.join(self.data_dir, "vocab.json")
+        self.legacy_vocab_path = os.path.join(self.data_dir, "vocab.yaml")
+        self.vocab_journal_path = os.path.join(self.data_dir, "vocab_journal.jsonl")
         self.progress_path = os.path.join(self.data_dir, "progress.json")
-        self.log_path = os.path.join(self.data_dir, "training_log.json")
+        self.log_path = os.path.join(self.data_dir, "training_log.jsonl")
         self.exam_log_path = os.path.join(self.data_dir, "exam_log.json")
         self.last_session_log_path = os.path.join(self.data_dir, "last_session_log.json")
         self.settings_path = os.path.join(self.data_dir, "settings.json")
-        self.beep_path = os.path.join(self.data_dir, "success.wav")
-        self.almost_beep_path = os.path.join(self.data_dir, "almost.wav")
-        self.new_card_beep_path = os.path.join(self.data_dir, "new_card.wav")
+        self.beep_path = os.path.join(SOUNDS_DIR, "success.wav")
+        self.almost_beep_path = os.path.join(SOUNDS_DIR, "almost.wav")
+        self.new_card_beep_path = os.path.join(SOUNDS_DIR, "new_card.wav")
         self.backup_dir = os.path.join(self.data_dir, "backups")
         os.makedirs(self.backup_dir, exist_ok=True)
 
-        self._ensure_seed_vocab()
-        self.vocab = self._load_vocab()
-        self.progress = _load_json(self.progress_path, {})
-        self.training_log = _load_json(self.log_path, [])
-        self.exam_log = _load_json(self.exam_log_path, [])
-        self.last_session_log = _load_json(self.last_session_log_path, {})
+        self._vocab_ver = 0
+        self._progress_ver = 0
+        self._seen_ids = {}
+        self._topic_cache = {}
         self.settings = _load_json(self.settings_path, {
             "review_topics_by_lang": {},
             "review_topic_filter_enabled": {},
             "backup_tree_uri": "",
         })
+        self._vocab_journal_dirty = False
+        self._ensure_seed_vocab()
+        self.vocab = self._load_vocab()
+        self._replay_vocab_journal()
+        self._reindex()
+        self.progress = _load_json(self.progress_path, {})
+        self.training_log = self._load_training_log()
+        self._counts_cache = None
+        self.exam_log = _load_json(self.exam_log_path, [])
+        self.last_session_log = _load_json(self.last_session_log_path, {})
         if not IS_ANDROID and not IS_IOS:
             self._init_desktop_debug_progress()
 
         try:
-            _ensure_beep(self.beep_path, freq=880.0, duration=0.12)
-            _ensure_beep(self.almost_beep_path, freq=660.0, duration=0.12)
-            _ensure_beep(self.new_card_beep_path, freq=520.0, duration=0.14)
             self._sound_success = SoundLoader.load(self.beep_path)
             self._sound_almost = SoundLoader.load(self.almost_beep_path)
             self._sound_new_card = SoundLoader.load(self.new_card_beep_path)
@@ -1057,6 +1236,8 @@ class JonMemApp(App):
         self._check_notification()
 
         self.session_items = []
+        self._session_items_by_id = {}
+        self._last_view_key = None
         self.session_index = 0
         self.session_correct = 0
         self.session_start = None
@@ -1064,6 +1245,7 @@ class JonMemApp(App):
         self.session_direction = "de_to_en"
         langs = self.get_target_languages()
         self.session_lang = langs[0] if langs else "en"
+        self._lang_prefix = f"Zielsprache ({self.session_lang.upper()}): "
         self.session_topic_filter_enabled = False
         self.session_topic_filter = set()
         self.time_left = SESSION_SECONDS
@@ -1071,21 +1253,18 @@ class JonMemApp(App):
         self._second_chance_active = False
         self._second_chance_item_id = None
         self._pending_new_card = None
-        self._intro_queue = []
+        self._intro_queue = deque()
+        self._answer_popup = None
+        self._answer_item = None
+        self._new_card_popup = None
+        self._new_card_open = False
+        self._new_card_on_close = None
         self._session_log_meta = {}
         self._session_log_entries = []
 
         self.sm = ScreenManager()
         self.screen_menu = MenuScreen(self, name="menu")
-        self.screen_setup = TrainingSetupScreen(self, name="setup")
-        self.screen_train = TrainingScreen(self, name="train")
-        self.screen_vocab = VocabScreen(self, name="vocab")
-        self.screen_calendar = CalendarScreen(self, name="calendar")
         self.sm.add_widget(self.screen_menu)
-        self.sm.add_widget(self.screen_setup)
-        self.sm.add_widget(self.screen_train)
-        self.sm.add_widget(self.screen_vocab)
-        self.sm.add_widget(self.screen_calendar)
         self.sm.current = "menu"
         return self.sm
 
@@ -1096,24 +1275,25 @@ class JonMemApp(App):
 
     def _on_window_focus(self, _window, focused: bool) -> None:
         if focused:
-            self._schedule_redraw(0.05)
+            self._focus_redraw_trigger()
 
     def _schedule_redraw(self, delay: float = 0.1) -> None:
-        def _apply(_dt):
-            self._force_redraw()
-            try:
-                if self.root:
-                    self.root.do_layout()
-            except Exception:
-                pass
-            try:
-                if self.sm:
-                    current = self.sm.current
-                    if current:
-                        self.sm.current = current
-            except Exception:
-                pass
-        Clock.schedule_once(_apply, delay)
+        Clock.schedule_once(self._apply_redraw, delay)
+
+    def _apply_redraw(self, *_) -> None:
+        self._force_redraw()
+        try:
+            if self.root:
+                self.root.do_layout()
+        except Exception:
+            pass
+        try:
+            if self.sm:
+                current = self.sm.current
+                if current:
+                    self.sm.current = current
+        except Exception:
+            pass
 
     def _force_redraw(self, *_):
         try:
@@ -1159,24 +1339,31 @@ class JonMemApp(App):
         return True
 
     def _flush_state(self) -> None:
+        self._save_trigger.cancel()
+        self._progress_save_trigger.cancel()
+        vocab_dirty = "vocab" in self._pending_saves or self._vocab_journal_dirty
+        self._pending_saves.clear()
+        if vocab_dirty:
+            try:
+                backup_io.save_json_file(self.vocab_path, self.vocab)
+                self._clear_vocab_journal()
+            except Exception as exc:
+                self._pending_saves.add("vocab")
+                self._log_error("flush vocab failed", exc)
         try:
-            self._save_vocab()
-        except Exception as exc:
-            self._log_error("flush vocab failed", exc)
-        try:
-            _save_json(self.progress_path, self.progress)
+            backup_io.save_json_file(self.progress_path, self.progress)
         except Exception as exc:
             self._log_error("flush progress failed", exc)
         try:
-            _save_json(self.log_path, self.training_log)
+            backup_io.save_json_file(self.settings_path, self.settings)
         except Exception as exc:
-            self._log_error("flush training log failed", exc)
+            self._log_error("flush settings failed", exc)
         try:
-            _save_json(self.exam_log_path, self.exam_log)
+            backup_io.save_json_file(self.exam_log_path, self.exam_log)
         except Exception as exc:
             self._log_error("flush exam log failed", exc)
         try:
-            _save_json(self.last_session_log_path, self.last_session_log)
+            backup_io.save_json_file(self.last_session_log_path, self.last_session_log)
         except Exception as exc:
             self._log_error("flush last session log failed", exc)
 
@@ -1236,6 +1423,7 @@ class JonMemApp(App):
 
     def _android_backup_mime_types(self) -> list[str]:
         return [
+            "application/json",
             "application/x-yaml",
             "text/yaml",
             "application/yaml",
@@ -1281,7 +1469,7 @@ class JonMemApp(App):
             filename = os.path.basename(pending_path)
             return _read_bytes(pending_path), filename
         payload = self._build_backup_payload()
-        return backup_io.dump_payload_to_yaml_bytes(payload), self._default_backup_filename()
+        return backup_io.dump_payload_bytes(payload), self._default_backup_filename()
 
     def _android_choose_backup_folder(
         self,
@@ -1435,8 +1623,7 @@ class JonMemApp(App):
                     continue
                 if mime_type == Document.MIME_TYPE_DIR:
                     continue
-                lower = name.lower()
-                if not lower.endswith(backup_io.ALLOWED_BACKUP_EXTS):
+                if not backup_io.has_backup_extension(name):
                     continue
                 doc_uri = DocumentsContract.buildDocumentUriUsingTree(tree, doc_id)
                 entries.append({
@@ -1626,8 +1813,7 @@ class JonMemApp(App):
                     handle.write(raw)
             except Exception:
                 pass
-            payload = backup_io.load_payload_from_yaml_bytes(raw)
-            self._preview_import_payload(payload, source_label=uri.toString())
+            self._preview_import_async(partial(backup_io.load_payload_bytes, raw), uri.toString())
         except Exception as exc:
             self._log_error("android import failed", exc)
             self._offer_android_import_fallback(f"Import-Fehler: {exc}")
@@ -1650,27 +1836,52 @@ class JonMemApp(App):
             msg += f": {exc}"
         self._error_log.append(msg)
         if exc is not None:
-            self._last_exception = traceback.format_exc()
+            self._last_exception = "".join(traceback.format_exception(exc))
 
     def _ensure_seed_vocab(self) -> None:
-        # On desktop, always start from seed data to simplify debugging.
-        if not IS_ANDROID and not IS_IOS:
-            try:
-                os.makedirs(os.path.dirname(self.vocab_path), exist_ok=True)
-                with open(SEED_VOCAB_PATH, "rb") as src, open(self.vocab_path, "wb") as dst:
-                    dst.write(src.read())
-            except Exception as exc:
-                self._log_error("seed copy failed", exc)
-            return
-        if os.path.exists(self.vocab_path):
+        # On desktop, always start from seed data to simplify debugging;
+        # an untouched copy of an unchanged seed is kept as is.
+        if IS_ANDROID or IS_IOS:
+            if os.path.exists(self.vocab_path):
+                return
+            if os.path.exists(self.legacy_vocab_path):
+                self._migrate_legacy_vocab()
+                return
+        try:
+            seed_mtime = os.stat(SEED_VOCAB_PATH).st_mtime_ns
+            vocab_mtime = os.stat(self.vocab_path).st_mtime_ns
+        except OSError:
+            seed_mtime = vocab_mtime = None
+        if (seed_mtime is not None
+                and self.settings.get("seed_mtime_ns") == seed_mtime
+                and self.settings.get("seed_vocab_mtime_ns") == vocab_mtime):
             return
         try:
             os.makedirs(os.path.dirname(self.vocab_path), exist_ok=True)
-            with open(SEED_VOCAB_PATH, "rb") as src, open(self.vocab_path, "wb") as dst:
-                dst.write(src.read())
+            seed_json = _fresh_yaml_cache(SEED_VOCAB_PATH)
+            if seed_json is not None:
+                backup_io.copy_file_atomic(seed_json, self.vocab_path)
+            else:
+                backup_io.save_json_file(self.vocab_path, _load_yaml(SEED_VOCAB_PATH))
+            self._clear_vocab_journal(force=True)
+            self.settings["seed_mtime_ns"] = os.stat(SEED_VOCAB_PATH).st_mtime_ns
+            self.settings["seed_vocab_mtime_ns"] = os.stat(self.vocab_path).st_mtime_ns
+            self._save_settings()
         except Exception as exc:
             self._log_error("seed copy failed", exc)
 
+    def _migrate_legacy_vocab(self) -> None:
+        try:
+            backup_io.save_json_file(self.vocab_path, _load_yaml_cached(self.legacy_vocab_path))
+        except Exception as exc:
+            self._log_error("vocab migration failed", exc)
+            return
+        for path in (self.legacy_vocab_path, f"{self.legacy_vocab_path}.json"):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
     def _init_desktop_debug_progress(self) -> None:
         rng = random.Random(1337)
         direction = "de_to_en"
@@ -1678,7 +1889,7 @@ class JonMemApp(App):
         topics = list(self.vocab.get("topics", []))
         rng.shuffle(topics)
         if not topics:
-            _save_json(self.progress_path, self.progress)
+            backup_io.save_json_file(self.progress_path, self.progress)
             return
         half_topic = topics[0]
         remaining = topics[1:]
@@ -1716,26 +1927,139 @@ class JonMemApp(App):
             for card in cards_by_topic.get(topic_id, []):
                 _apply_progress(card)
 
-        _save_json(self.progress_path, self.progress)
+        backup_io.save_json_file(self.progress_path, self.progress)
+
+    def _load_training_log(self) -> list:
+        legacy_path = os.path.join(self.data_dir, "training_log.json")
+        if not os.path.exists(self.log_path) and os.path.exists(legacy_path):
+            try:
+                backup_io.save_jsonl_file(self.log_path, _load_json(legacy_path, []))
+                os.remove(legacy_path)
+            except Exception as exc:
+                self._log_error("training log migration failed", exc)
+        try:
+            return backup_io.load_jsonl_file(self.log_path, [])
+        except Exception as exc:
+            self._log_error("training log load failed", exc)
+            return []
 
     def _load_vocab(self) -> dict:
         try:
-            return _load_yaml(self.vocab_path)
+            data = _load_json(self.vocab_path, None)
+            if not isinstance(data, dict):
+                raise ValueError("invalid vocab structure")
+            return data
         except Exception as exc:
             self._log_error("vocab load failed", exc)
             return {"meta": {}, "topics": [], "cards": []}
 
-    def _save_vocab(self) -> None:
+    def _reindex(self) -> None:
+        self._cards_by_id: dict[str, dict] = {}
+        self._cards_by_topic: dict[tuple[str, str], list[dict]] = {}
+        self._cards_by_lang: dict[str, list[dict]] = {}
+        self._topics_by_lang: dict[str, list[dict]] = {}
+        self._topic_by_id: dict[str, dict] = {}
+        self._topic_by_lang_id: dict[tuple[str, str], dict] = {}
+        self._topic_id_by_name: dict[tuple[str, str], str] = {}
+        for topic in self.vocab.get("topics", []):
+            self._index_topic(topic)
+        for card in self.vocab.get("cards", []):
+            self._index_card(card)
+        self._vocab_ver += 1
+
+    def _index_topic(self, topic: dict) -> None:
+        lang = topic.get("lang", "en")
+        topic_id = topic.get("id")
+        self._topics_by_lang.setdefault(lang, []).append(topic)
+        self._topic_by_id.setdefault(topic_id, topic)
+        self._topic_by_lang_id.setdefault((lang, topic_id), topic)
+        self._topic_id_by_name.setdefault((lang, topic.get("name")), topic_id)
+
+    def _index_card(self, card: dict) -> None:
+        card_id = card.get("id")
+        if card_id:
+            self._cards_by_id.setdefault(card_id, card)
+        lang = card.get("lang", "en")
+        self._cards_by_lang.setdefault(lang, []).append(card)
+        self._cards_by_topic.setdefault((lang, card.get("topic")), []).append(card)
+
+    def _unindex_card(self, card: dict) -> None:
+        card_id = card.get("id")
+        if card_id and self._cards_by_id.get(card_id) is card:
+            del self._cards_by_id[card_id]
+        lang = card.get("lang", "en")
+        for cards in (self._cards_by_lang.get(lang), self._cards_by_topic.get((lang, card.get("topic")))):
+            if cards is not None:
+                cards[:] = [item for item in cards if item is not card]
+
+    def _replay_vocab_journal(self) -> None:
+        entries = backup_io.load_jsonl_file(self.vocab_journal_path, [])
+        if not entries:
+            return
         try:
-            _save_yaml(self.vocab_path, self.vocab)
+            if backup_io.apply_vocab_journal(self.vocab, entries):
+                backup_io.save_json_file(self.vocab_path, self.vocab)
+            self._clear_vocab_journal(force=True)
         except Exception as exc:
-            self._log_error("vocab save failed", exc)
+            self._log_error("vocab journal replay failed", exc)
 
-    def _save_settings(self) -> None:
+    def _journal_vocab(self, entry: dict) -> None:
         try:
-            _save_json(self.settings_path, self.settings)
+            backup_io.append_jsonl(self.vocab_journal_path, entry)
+            self._vocab_journal_dirty = True
         except Exception as exc:
-            self._log_error("settings save failed", exc)
+            self._log_error("vocab journal write failed", exc)
+
+    def _clear_vocab_journal(self, force: bool = False) -> None:
+        if not (self._vocab_journal_dirty or force):
+            return
+        try:
+            os.remove(self.vocab_journal_path)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            self._log_error("vocab journal cleanup failed", exc)
+            return
+        self._vocab_journal_dirty = False
+
+    def _save_vocab(self, entry: dict | None = None) -> None:
+        if entry is not None:
+            self._journal_vocab(entry)
+        self._pending_saves.add("vocab")
+        self._save_trigger()
+
+    def _save_settings(self) -> None:
+        self._pending_saves.add("settings")
+        self._save_trigger()
+
+    def _save_progress(self) -> None:
+        self._progress_ver += 1
+        self._pending_saves.add("progress")
+        self._progress_save_trigger()
+
+    def _flush_pending_saves(self, *_) -> None:
+        self._save_trigger.cancel()
+        self._progress_save_trigger.cancel()
+        pending, self._pending_saves = self._pending_saves, set()
+        targets = (
+            ("vocab", self.vocab_path, self.vocab),
+            ("settings", self.settings_path, self.settings),
+            ("progress", self.progress_path, self.progress),
+        )
+        for name, path, data in targets:
+            if name not in pending:
+                continue
+            try:
+                backup_io.save_json_file(path, data)
+                if name == "vocab":
+                    self._clear_vocab_journal()
+            except Exception as exc:
+                self._log_error(f"{name} save failed", exc)
+                self._pending_saves.add(name)
+                if name == "progress":
+                    self._progress_save_trigger()
+                else:
+                    self._save_trigger()
 
     def get_target_languages(self):
         meta = self.vocab.get("meta", {})
@@ -1753,28 +2077,36 @@ class JonMemApp(App):
         langs = meta.get("target_langs") or []
         if isinstance(langs, str):
             langs = [langs]
-        if lang not in langs:
-            langs.append(lang)
+        if lang in langs:
+            return
+        langs.append(lang)
         meta["target_langs"] = langs
-        self._save_vocab()
+        self._save_vocab({"op": "meta", "meta": meta})
+
+    def _cached_topics(self, key: tuple, compute):
+        key = (*key, self._vocab_ver, self._progress_ver)
+        items = self._topic_cache.get(key)
+        if items is None:
+            if len(self._topic_cache) >= 32:
+                self._topic_cache.clear()
+            items = self._topic_cache[key] = compute()
+        return items
 
     def get_learned_topics(self, lang: str):
         lang = (lang or "").strip()
         if not lang:
             return []
-        topic_map = {}
-        for topic in self.vocab.get("topics", []):
-            if topic.get("lang", "en") == lang:
-                topic_map[topic.get("id")] = topic.get("name", "")
+        return self._cached_topics(("learned", lang), partial(self._learned_topics, lang))
+
+    def _learned_topics(self, lang: str):
         learned_ids = set()
-        for card in self.vocab.get("cards", []):
-            if card.get("lang", "en") != lang:
-                continue
-            if card.get("id") in self.progress:
-                learned_ids.add(card.get("topic"))
+        for (card_lang, topic_id), cards in self._cards_by_topic.items():
+            if card_lang == lang and any(card.get("id") in self.progress for card in cards):
+                learned_ids.add(topic_id)
         topics = []
         for topic_id in learned_ids:
-            name = topic_map.get(topic_id, topic_id or "")
+            topic = self._topic_by_lang_id.get((lang, topic_id))
+            name = topic.get("name", "") if topic else (topic_id or "")
             if name:
                 topics.append({"id": topic_id, "name": name})
         topics.sort(key=lambda item: item["name"].lower())
@@ -1806,58 +2138,50 @@ class JonMemApp(App):
     def ensure_topic(self, lang: str, topic: str) -> str:
         topic = topic.strip() or "Allgemein"
         topic_id = _slugify(topic)
-        topics = self.vocab.get("topics", [])
-        if not any(t.get("id") == topic_id and t.get("lang", "en") == lang for t in topics):
-            topics.append({"id": topic_id, "name": topic, "lang": lang})
-        self.vocab["topics"] = topics
-        self._save_vocab()
+        if (lang, topic_id) in self._topic_by_lang_id:
+            return topic_id
+        entry = {"id": topic_id, "name": topic, "lang": lang}
+        self.vocab.setdefault("topics", []).append(entry)
+        self._index_topic(entry)
+        self._vocab_ver += 1
+        self._save_vocab({"op": "topic", "topic": entry})
         return topic_id
 
     def get_topics(self, lang: str):
-        topics = []
-        for topic in self.vocab.get("topics", []):
-            if topic.get("lang", "en") == lang:
-                topics.append(topic.get("name", ""))
+        topics = [topic.get("name", "") for topic in self._topics_by_lang.get(lang, [])]
         return [t for t in topics if t]
 
     def get_topic_name(self, topic_id: str | None, lang: str | None = None) -> str:
         if not topic_id:
             return ""
-        for topic in self.vocab.get("topics", []):
-            if topic.get("id") != topic_id:
-                continue
-            if lang and topic.get("lang", "en") != lang:
-                continue
-            return topic.get("name", "") or topic_id
-        return topic_id
+        topic = self._topic_by_lang_id.get((lang, topic_id)) if lang else self._topic_by_id.get(topic_id)
+        if topic is None:
+            return topic_id
+        return topic.get("name", "") or topic_id
 
     def get_intro_topic_progress(self, lang: str, direction: str) -> list[dict]:
         if not lang:
             return []
-        topics = [t for t in self.vocab.get("topics", []) if t.get("lang", "en") == lang]
-        topic_names = {t.get("id"): t.get("name", "") for t in topics}
-        totals: dict[str, int] = {}
-        introduced: dict[str, int] = {}
-        for card in self.vocab.get("cards", []):
-            if card.get("lang", "en") != lang:
-                continue
-            topic_id = card.get("topic")
-            if not topic_id:
-                continue
-            totals[topic_id] = totals.get(topic_id, 0) + 1
-            if self.progress.get(card.get("id", ""), {}).get(direction) is not None:
-                introduced[topic_id] = introduced.get(topic_id, 0) + 1
+        return self._cached_topics(("intro", lang, direction),
+                                   partial(self._intro_topic_progress, lang, direction))
+
+    def _intro_topic_progress(self, lang: str, direction: str) -> list[dict]:
+        progress_get = self.progress.get
         items = []
-        for topic_id, total in totals.items():
-            if total <= 0:
+        for (card_lang, topic_id), cards in self._cards_by_topic.items():
+            if card_lang != lang or not topic_id:
                 continue
-            done = introduced.get(topic_id, 0)
+            total = len(cards)
+            done = 0
+            for card in cards:
+                if progress_get(card.get("id", ""), _EMPTY).get(direction) is not None:
+                    done += 1
             percent = int(round((done / total) * 100))
             if percent >= 100:
                 continue
             items.append({
                 "id": topic_id,
-                "name": topic_names.get(topic_id, "") or topic_id,
+                "name": self.get_topic_name(topic_id, lang),
                 "percent": percent,
                 "total": total,
                 "done": done,
@@ -1868,24 +2192,20 @@ class JonMemApp(App):
     def _is_topic_complete(self, topic_id: str, lang: str, direction: str) -> bool:
         if not topic_id or not lang:
             return False
-        total = 0
-        done = 0
-        for card in self.vocab.get("cards", []):
-            if card.get("lang", "en") != lang:
-                continue
-            if card.get("topic") != topic_id:
-                continue
-            total += 1
-            if self.progress.get(card.get("id", ""), {}).get(direction) is not None:
-                done += 1
-        return total > 0 and done >= total
+        cards = self._cards_by_topic.get((lang, topic_id))
+        if not cards:
+            return False
+        progress_get = self.progress.get
+        for card in cards:
+            if progress_get(card.get("id", ""), _EMPTY).get(direction) is None:
+                return False
+        return True
 
     def get_completed_topics(self, lang: str, direction: str) -> list[dict]:
         if not lang:
             return []
-        topics = [t for t in self.vocab.get("topics", []) if t.get("lang", "en") == lang]
         items = []
-        for topic in topics:
+        for topic in self._topics_by_lang.get(lang, []):
             topic_id = topic.get("id")
             if not topic_id:
                 continue
@@ -1895,26 +2215,15 @@ class JonMemApp(App):
         return items
 
     def get_cards_for_topic(self, lang: str, topic_name: str):
-        topic_id = None
-        for topic in self.vocab.get("topics", []):
-            if topic.get("name") == topic_name and topic.get("lang", "en") == lang:
-                topic_id = topic.get("id")
-                break
+        topic_id = self._topic_id_by_name.get((lang, topic_name))
         if not topic_id:
             return []
-        cards = []
-        for card in self.vocab.get("cards", []):
-            if card.get("topic") == topic_id and card.get("lang", "en") == lang:
-                cards.append(card)
-        return cards
+        return list(self._cards_by_topic.get((lang, topic_id), []))
 
     def _get_card_by_id(self, card_id: str) -> dict | None:
         if not card_id:
             return None
-        for card in self.vocab.get("cards", []):
-            if card.get("id") == card_id:
-                return card
-        return None
+        return self._cards_by_id.get(card_id)
 
     def _save_card_mnemonic(self, card_id: str | None, text: str) -> None:
         if not card_id:
@@ -1926,7 +2235,7 @@ class JonMemApp(App):
         if card.get("mnemonic", "") == cleaned:
             return
         card["mnemonic"] = cleaned
-        self._save_vocab()
+        self._save_vocab({"op": "card", "card": card})
 
     def _save_card_hint(self, card_id: str | None, direction: str, text: str) -> None:
         if not card_id:
@@ -1939,18 +2248,26 @@ class JonMemApp(App):
         if (card.get(key, "") or "").strip() == cleaned:
             return
         card[key] = cleaned
-        self._save_vocab()
+        self._save_vocab({"op": "card", "card": card})
+
+    def _show_screen(self, name: str) -> None:
+        if not self.sm.has_screen(name):
+            attr, screen_cls = self._LAZY_SCREENS[name]
+            screen = screen_cls(self, name=name)
+            setattr(self, attr, screen)
+            self.sm.add_widget(screen)
+        self.sm.current = name
 
-    def show_training_setup(self) -> None:
-        self.sm.current = "setup"
+    def show_training_setup(self, *_) -> None:
+        self._show_screen("setup")
 
-    def show_vocab(self) -> None:
-        self.sm.current = "vocab"
+    def show_vocab(self, *_) -> None:
+        self._show_screen("vocab")
 
-    def show_calendar(self) -> None:
-        self.sm.current = "calendar"
+    def show_calendar(self, *_) -> None:
+        self._show_screen("calendar")
 
-    def show_menu(self) -> None:
+    def show_menu(self, *_) -> None:
         self.sm.current = "menu"
 
     def open_menu(self, *_):
@@ -1989,6 +2306,7 @@ class JonMemApp(App):
         if IS_ANDROID:
             self._export_backup_android()
             return
+        filechooser = _load_filechooser()
         if filechooser is not None and hasattr(filechooser, "save_file"):
             try:
                 paths = filechooser.save_file(title="Datenbank Export", path=os.path.expanduser("~"),
@@ -2005,6 +2323,7 @@ class JonMemApp(App):
             if tk_path:
                 self._export_backup_to(tk_path)
                 return
+        filechooser = _load_filechooser()
         if filechooser is not None and hasattr(filechooser, "choose_dir"):
             self._export_backup_choose_dir()
             return
@@ -2042,7 +2361,7 @@ class JonMemApp(App):
 
     def _export_backup_choose_dir(self) -> None:
         try:
-            dirs = filechooser.choose_dir(title="Datenbank Export", path=os.path.expanduser("~"))
+            dirs = _load_filechooser().choose_dir(title="Datenbank Export", path=os.path.expanduser("~"))
             if not dirs:
                 self._export_backup_prompt()
                 return
@@ -2056,51 +2375,87 @@ class JonMemApp(App):
 
     def _export_backup_prompt(self) -> None:
         default_path = os.path.join(self.backup_dir, self._default_backup_filename())
-        box = BoxLayout(orientation="vertical", spacing=_ui(6), padding=_ui(8))
-        box.add_widget(_styled_label("Pfad für Exportdatei"))
-        path_input = _styled_text_input(multiline=False, text=default_path)
-        box.add_widget(path_input)
 
-        def do_export(_):
+        def do_export(inputs):
             popup.dismiss()
-            self._export_backup_to(path_input.text.strip(), show_path=True)
+            self._export_backup_to(inputs["path"].text.strip(), show_path=True)
 
-        btn_row = BoxLayout(size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT), spacing=_ui(8))
-        btn_row.add_widget(Button(text="Exportieren", on_release=do_export))
-        btn_row.add_widget(Button(text="Abbrechen", on_release=lambda *_: popup.dismiss()))
-        box.add_widget(btn_row)
-        popup = _styled_popup(title="Datenbank Export", content=_make_scrollable(box), size_hint=(0.9, 0.5))
+        popup, _inputs = _build_form_popup("Datenbank Export", [("Pfad für Exportdatei", "path")], "Exportieren",
+                                           do_export, values={"path": default_path}, spacing=6)
         popup.open()
 
     def _export_backup_fallback(self) -> None:
         path = os.path.join(self.backup_dir, self._default_backup_filename())
         self._export_backup_to(path, show_path=True)
 
+    def _run_in_background(self, work, on_done) -> None:
+        def _worker():
+            try:
+                result, error = work(), None
+            except Exception as exc:
+                result, error = None, exc
+            finally:
+                if IS_ANDROID:
+                    try:
+                        from jnius import detach  # type: ignore
+                        detach()
+                    except Exception:
+                        pass
+            Clock.schedule_once(lambda *_: on_done(result, error), 0)
+
+        threading.Thread(target=_worker, daemon=True).start()
+
     def _export_backup_to(self, path: str, show_path: bool = False) -> None:
+        def fail(exc):
+            self._log_error("backup export failed", exc)
+            _styled_popup(title="Datenbank Export", content=Label(text=f"Fehler: {exc}"), size_hint=(0.9, 0.4)).open()
+
         self._flush_state()
-        payload = self._build_backup_payload()
         try:
-            path = _normalize_path(path.strip())
-            path = _ensure_backup_extension(path)
-            if _is_content_uri(path):
-                data = backup_io.dump_payload_to_yaml_bytes(payload)
-                _android_write_uri(path, data)
-                text = "Export erfolgreich."
+            path = _ensure_backup_extension(_normalize_path(path.strip()))
+            content_uri = _is_content_uri(path)
+            if backup_io.is_yaml_backup_path(path):
+                payload = copy.deepcopy(self._build_backup_payload())
+                raw = None
+            else:
+                payload = None
+                raw = backup_io.dump_payload_bytes(self._build_backup_payload(), path)
+        except Exception as exc:
+            fail(exc)
+            return
+
+        def work():
+            if content_uri:
+                if raw is not None:
+                    _android_write_uri(path, raw)
+                    return
+                with tempfile.SpooledTemporaryFile(max_size=1 << 20) as spool:
+                    backup_io.write_payload(spool, payload, path)
+                    spool.seek(0)
+                    _android_write_uri(path, spool)
+                return
+            dir_path = os.path.dirname(path)
+            if dir_path:
+                os.makedirs(dir_path, exist_ok=True)
+            if raw is not None:
+                backup_io.write_bytes_atomic(path, raw)
             else:
-                dir_path = os.path.dirname(path)
-                if dir_path:
-                    os.makedirs(dir_path, exist_ok=True)
                 backup_io.persist_payload_to_file(path, payload)
-                text = f"Gespeichert:\n{path}" if show_path else "Export erfolgreich."
+
+        def done(_result, error):
+            if error is not None:
+                fail(error)
+                return
+            text = f"Gespeichert:\n{path}" if show_path and not content_uri else "Export erfolgreich."
             _styled_popup(title="Datenbank Export", content=Label(text=text), size_hint=(0.9, 0.4)).open()
-        except Exception as exc:
-            self._log_error("backup export failed", exc)
-            _styled_popup(title="Datenbank Export", content=Label(text=f"Fehler: {exc}"), size_hint=(0.9, 0.4)).open()
+
+        self._run_in_background(work, done)
 
     def _import_backup_prompt(self) -> None:
         if IS_ANDROID:
             self._import_backup_android()
             return
+        filechooser = _load_filechooser()
         if filechooser is not None and hasattr(filechooser, "open_file"):
             try:
                 paths = filechooser.open_file(title="Datenbank Import", path=os.path.expanduser("~"),
@@ -2112,43 +2467,43 @@ class JonMemApp(App):
             except Exception as exc:
                 self._log_error("filechooser open failed", exc)
 
-        box = BoxLayout(orientation="vertical", spacing=_ui(6), padding=_ui(8))
-        box.add_widget(_styled_label("Pfad zur YAML-Datei"))
-        path_input = _styled_text_input(multiline=False, text="")
-        box.add_widget(path_input)
-
-        def do_import(_):
+        def do_import(inputs):
             popup.dismiss()
-            self._preview_import_from_path(path_input.text.strip())
+            self._preview_import_from_path(inputs["path"].text.strip())
 
-        btn_row = BoxLayout(size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT), spacing=_ui(8))
-        btn_row.add_widget(Button(text="Importieren", on_release=do_import))
-        btn_row.add_widget(Button(text="Abbrechen", on_release=lambda *_: popup.dismiss()))
-        box.add_widget(btn_row)
-        popup = _styled_popup(title="Datenbank Import", content=_make_scrollable(box), size_hint=(0.9, 0.5))
+        popup, _inputs = _build_form_popup("Datenbank Import", [("Pfad zur Backup-Datei", "path")], "Importieren",
+                                           do_import, spacing=6)
         popup.open()
 
     def _preview_import_from_path(self, path: str) -> None:
-        try:
-            path = _normalize_path(path.strip())
-            if not path:
-                return
-            if _is_content_uri(path):
+        path = _normalize_path(path.strip())
+        if not path:
+            return
+        if _is_content_uri(path):
+            try:
                 raw = _android_read_uri(path)
-                payload = backup_io.load_payload_from_yaml_bytes(raw)
-                source_label = path
-            else:
-                payload = backup_io.load_payload_from_path(path)
-                source_label = path
+            except Exception as exc:
+                self._log_error("backup import load failed", exc)
+                _styled_popup(title="Datenbank Import", content=Label(text=f"Import-Fehler: {exc}"), size_hint=(0.8, 0.4)).open()
+                return
+            self._preview_import_async(partial(backup_io.load_payload_bytes, raw), path)
+        else:
+            self._preview_import_async(partial(backup_io.load_payload_from_path, path), path)
+
+    def _preview_import_async(self, load, source_label: str) -> None:
+        def done(payload, error):
+            if error is not None:
+                self._log_error("backup import load failed", error)
+                _styled_popup(title="Datenbank Import", content=Label(text=f"Import-Fehler: {error}"), size_hint=(0.8, 0.4)).open()
+                return
             self._preview_import_payload(payload, source_label)
-        except Exception as exc:
-            self._log_error("backup import load failed", exc)
-            _styled_popup(title="Datenbank Import", content=Label(text=f"Import-Fehler: {exc}"), size_hint=(0.8, 0.4)).open()
+
+        self._run_in_background(load, done)
 
     def _preview_import_payload(self, payload: dict, source_label: str) -> None:
         try:
             payload = backup_io.normalize_backup_payload(payload)
-            scan = backup_io.scan_backup_payload(payload)
+            scan = backup_io.scan_backup_payload_normalized(payload)
         except Exception as exc:
             self._log_error("backup import scan failed", exc)
             _styled_popup(title="Datenbank Import", content=Label(text=f"Import-Fehler: {exc}"), size_hint=(0.8, 0.4)).open()
@@ -2212,12 +2567,17 @@ class JonMemApp(App):
             training_log_path=self.log_path,
             exam_log_path=self.exam_log_path,
         )
+        self._clear_vocab_journal(force=True)
 
     def _apply_payload_to_state(self, payload: dict) -> None:
         self.vocab = payload.get("vocab", {})
         self.progress = payload.get("progress", {})
+        self._progress_ver += 1
+        self._seen_ids = {}
         self.training_log = payload.get("training_log", [])
+        self._counts_cache = None
         self.exam_log = payload.get("exam_log", [])
+        self._reindex()
 
     def _offer_import_rollback(self, exc: Exception, rollback_path: str | None) -> None:
         lines = [f"Import-Fehler: {exc}"]
@@ -2283,16 +2643,19 @@ class JonMemApp(App):
     def _apply_import_data(self, data: dict) -> None:
         if "vocab" in data:
             self.vocab = data["vocab"]
+            self._reindex()
             self._save_vocab()
         if "progress" in data:
             self.progress = data["progress"]
-            _save_json(self.progress_path, self.progress)
+            self._seen_ids = {}
+            self._save_progress()
         if "training_log" in data:
             self.training_log = data["training_log"]
-            _save_json(self.log_path, self.training_log)
+            self._counts_cache = None
+            backup_io.save_jsonl_file(self.log_path, self.training_log)
         if "exam_log" in data:
             self.exam_log = data["exam_log"]
-            _save_json(self.exam_log_path, self.exam_log)
+            backup_io.save_json_file(self.exam_log_path, self.exam_log)
 
     def show_intro_category_picker(self, lang: str, direction: str) -> None:
         lang = (lang or "").strip()
@@ -2477,20 +2840,13 @@ class JonMemApp(App):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         default_name = f"jonmem_session_{timestamp}.txt"
         default_path = os.path.join(default_dir, default_name)
-        box = BoxLayout(orientation="vertical", spacing=_ui(6), padding=_ui(8))
-        box.add_widget(_styled_label("Pfad für Session-Protokoll"))
-        path_input = _styled_text_input(multiline=False, text=default_path)
-        box.add_widget(path_input)
 
-        def _save(_):
+        def _save(inputs):
             popup.dismiss()
-            self._save_last_session_log_to(path_input.text.strip())
+            self._save_last_session_log_to(inputs["path"].text.strip())
 
-        btn_row = BoxLayout(size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT), spacing=_ui(8))
-        btn_row.add_widget(Button(text="Speichern", on_release=_save))
-        btn_row.add_widget(Button(text="Abbrechen", on_release=lambda *_: popup.dismiss()))
-        box.add_widget(btn_row)
-        popup = _styled_popup(title="Session-Protokoll speichern", content=_make_scrollable(box), size_hint=(0.9, 0.5))
+        popup, _inputs = _build_form_popup("Session-Protokoll speichern", [("Pfad für Session-Protokoll", "path")],
+                                           "Speichern", _save, values={"path": default_path}, spacing=6)
         popup.open()
 
     def _save_last_session_log_to(self, path: str) -> None:
@@ -2548,10 +2904,13 @@ class JonMemApp(App):
             return
         topic = topic.strip() or "Allgemein"
         topic_id = self.ensure_topic(lang, topic)
-        cards = self.vocab.get("cards", [])
-        idx = sum(1 for c in cards if c.get("topic") == topic_id and c.get("lang", "en") == lang) + 1
+        cards = self.vocab.setdefault("cards", [])
+        idx = len(self._cards_by_topic.get((lang, topic_id), [])) + 1
         card_id = f"{topic_id}_{idx:03d}_{lang}"
-        cards.append({
+        while card_id in self._cards_by_id:
+            idx += 1
+            card_id = f"{topic_id}_{idx:03d}_{lang}"
+        card = {
             "id": card_id,
             "topic": topic_id,
             "lang": lang,
@@ -2560,8 +2919,11 @@ class JonMemApp(App):
             "hint_de_to_en": hint_de,
             "hint_en_to_de": hint_en,
             "mnemonic": "",
-        })
-        self.vocab["cards"] = cards
+        }
+        cards.append(card)
+        self._index_card(card)
+        self._vocab_ver += 1
+        self._journal_vocab({"op": "card", "card": card})
         meta = self.vocab.setdefault("meta", {})
         target_langs = meta.get("target_langs") or []
         if isinstance(target_langs, str):
@@ -2569,33 +2931,38 @@ class JonMemApp(App):
         if lang not in target_langs:
             target_langs.append(lang)
         meta["target_langs"] = target_langs
-        self._save_vocab()
+        self._save_vocab({"op": "meta", "meta": meta})
         _styled_popup(title="Vokabeln", content=Label(text="Gespeichert."), size_hint=(0.4, 0.3)).open()
 
     def update_card(self, card_id: str, de: str, en: str, hint_de: str, hint_en: str) -> None:
         if not card_id:
             return
-        cards = self.vocab.get("cards", [])
-        for card in cards:
-            if card.get("id") == card_id:
-                card["de"] = de
-                card["en"] = en
-                card["hint_de_to_en"] = hint_de
-                card["hint_en_to_de"] = hint_en
-                break
-        self.vocab["cards"] = cards
-        self._save_vocab()
+        card = self._cards_by_id.get(card_id)
+        if card is None:
+            return
+        card.update(de=de, en=en, hint_de_to_en=hint_de, hint_en_to_de=hint_en)
+        self._save_vocab({"op": "card", "card": card})
 
     def delete_card(self, card_id: str) -> None:
         if not card_id:
             return
-        cards = self.vocab.get("cards", [])
-        cards = [card for card in cards if card.get("id") != card_id]
-        self.vocab["cards"] = cards
         if card_id in self.progress:
             self.progress.pop(card_id, None)
-            _save_json(self.progress_path, self.progress)
-        self._save_vocab()
+            for seen in self._seen_ids.values():
+                seen.discard(card_id)
+            self._save_progress()
+        if card_id not in self._cards_by_id:
+            return
+        cards = self.vocab["cards"]
+        kept = []
+        for card in cards:
+            if card.get("id") == card_id:
+                self._unindex_card(card)
+            else:
+                kept.append(card)
+        cards[:] = kept
+        self._vocab_ver += 1
+        self._save_vocab({"op": "delete", "id": card_id})
 
     def start_training(self, mode: str, direction: str, lang: str,
                        topic_filter: list[str] | None = None, topic_filter_enabled: bool = False,
@@ -2603,6 +2970,7 @@ class JonMemApp(App):
         self.session_mode = mode
         self.session_direction = direction
         self.session_lang = lang or "en"
+        self._lang_prefix = f"Zielsprache ({self.session_lang.upper()}): "
         self.session_topic_filter_enabled = bool(topic_filter_enabled)
         self.session_topic_filter = set(topic_filter or [])
         self.session_intro_topic = None
@@ -2626,16 +2994,15 @@ class JonMemApp(App):
                 topic_id, self.session_lang, self.session_direction
             )
             unseen_cards = self._get_unseen_cards(topic_id=topic_id)
-            rng = random
-            rng.shuffle(unseen_cards)
             unique_limit = max(1, SESSION_MAX_ITEMS // max(1, INTRODUCE_REPEAT_COUNT))
-            unseen_items = [self._card_to_item(card) for card in unseen_cards[:unique_limit]]
+            unseen_cards = random.sample(unseen_cards, min(len(unseen_cards), unique_limit))
+            unseen_items = _cards_to_items(unseen_cards, self.session_direction, self.progress)
             for item in unseen_items:
                 item["intro_new"] = True
             if len(unseen_items) < unique_limit:
                 needed = unique_limit - len(unseen_items)
                 review_fill = training.build_session_items(
-                    self.vocab.get("cards", []),
+                    self._cards_by_lang.get(self.session_lang, []),
                     self.progress,
                     mode="review",
                     direction=self.session_direction,
@@ -2658,7 +3025,7 @@ class JonMemApp(App):
             session = unique_items * max(1, INTRODUCE_REPEAT_COUNT)
             session = training.shuffle_avoid_adjacent(session, "id", random)
             self.session_items = self._defer_intro_items(session)[:SESSION_MAX_ITEMS]
-            self._intro_queue = list(unseen_items)
+            self._intro_queue = deque(unseen_items)
         elif mode == "exam":
             if not intro_topic_id:
                 _styled_popup(title="Prüfung", content=Label(text="Bitte eine Kategorie wählen."),
@@ -2666,20 +3033,21 @@ class JonMemApp(App):
                 return
             topic_id = intro_topic_id
             self.exam_category_id = topic_id
-            cards = [c for c in self.vocab.get("cards", [])
-                     if c.get("lang", "en") == self.session_lang and c.get("topic") == topic_id]
+            cards = self._cards_by_topic.get((self.session_lang, topic_id), [])
             if not cards:
                 _styled_popup(title="Prüfung", content=Label(text="Keine Karten in der Kategorie."),
                               size_hint=(0.7, 0.3)).open()
                 return
-            items = []
-            for card in cards:
-                prog = self.progress.get(card.get("id", ""), {}).get(self.session_direction)
-                items.append(self._card_to_item(card, prog))
+            items = _cards_to_items(cards, self.session_direction, self.progress)
             random.shuffle(items)
             self.session_items = items
         else:
             self.session_items = self._build_session_items(mode, direction)
+        self._session_items_by_id = {}
+        self._last_view_key = None
+        for item in self.session_items:
+            if item.get("id"):
+                self._session_items_by_id.setdefault(item["id"], item)
         if not self.session_items:
             _styled_popup(title="Training", content=Label(text="Keine passenden Karten gefunden."), size_hint=(0.6, 0.3)).open()
             return
@@ -2708,18 +3076,18 @@ class JonMemApp(App):
         self._second_chance_active = False
         self._second_chance_item_id = None
         self._pending_new_card = None
-        self.sm.current = "train"
+        self._show_screen("train")
         if mode == "introduce":
             if not self._intro_queue:
-                self._intro_queue = list(self.session_items)
+                self._intro_queue = deque(self.session_items)
             self._show_next_intro_card()
         else:
-            self._intro_queue = []
+            self._intro_queue = deque()
             self._start_timer()
 
     def _build_session_items(self, mode: str, direction: str):
         return training.build_session_items(
-            self.vocab.get("cards", []),
+            self._cards_by_lang.get(self.session_lang, []),
             self.progress,
             mode=mode,
             direction=direction,
@@ -2744,48 +3112,33 @@ class JonMemApp(App):
                 remaining.append(item)
         return remaining + deferred
 
-    def _card_to_item(self, card: dict, prog: dict | None = None) -> dict:
-        stage = 1
-        if prog is None:
-            prog = self.progress.get(card.get("id", ""), {}).get(self.session_direction)
-        if prog is not None:
-            stage = int(prog.get("stage", 1))
-        return {
-            "id": card.get("id"),
-            "prompt": card.get("de") if self.session_direction == "de_to_en" else card.get("en"),
-            "answer": card.get("en") if self.session_direction == "de_to_en" else card.get("de"),
-            "hint": card.get("hint_de_to_en") if self.session_direction == "de_to_en" else card.get("hint_en_to_de"),
-            "de": card.get("de", ""),
-            "en": card.get("en", ""),
-            "hint_de_to_en": card.get("hint_de_to_en", ""),
-            "hint_en_to_de": card.get("hint_en_to_de", ""),
-            "mnemonic": card.get("mnemonic", ""),
-            "stage": stage,
-            "topic": card.get("topic"),
-            "lang": card.get("lang", "en"),
-        }
+    def _seen_ids_for(self, direction: str) -> set[str]:
+        seen = self._seen_ids.get(direction)
+        if seen is None:
+            seen = self._seen_ids[direction] = {
+                card_id for card_id, entry in self.progress.items() if entry.get(direction) is not None
+            }
+        return seen
 
-    def _get_unseen_cards(self, *, exclude_ids: set[str] | None = None, topic_id: str | None = None) -> list[dict]:
-        exclude_ids = exclude_ids or set()
-        cards = training.list_unseen_cards(
-            self.vocab.get("cards", []),
-            self.progress,
-            direction=self.session_direction,
-            lang=self.session_lang,
-        )
+    def _get_unseen_cards(self, *, exclude_ids=None, topic_id: str | None = None) -> list[dict]:
+        seen = self._seen_ids_for(self.session_direction)
+        exclude_ids = exclude_ids or ()
         if topic_id:
-            cards = [card for card in cards if card.get("topic") == topic_id]
-        return [card for card in cards if card.get("id") not in exclude_ids]
+            cards = self._cards_by_topic.get((self.session_lang, topic_id), [])
+        else:
+            cards = self._cards_by_lang.get(self.session_lang, [])
+        return [card for card in cards
+                if (card_id := card.get("id")) and card_id not in seen and card_id not in exclude_ids]
 
     def _queue_new_intro_card(self) -> None:
-        existing_ids = {item.get("id") for item in self.session_items if item.get("id")}
         topic_id = self.session_intro_topic if self.session_mode == "introduce" else None
-        unseen_cards = self._get_unseen_cards(exclude_ids=existing_ids, topic_id=topic_id)
+        unseen_cards = self._get_unseen_cards(exclude_ids=self._session_items_by_id.keys(), topic_id=topic_id)
         if not unseen_cards:
             return
-        new_item = self._card_to_item(unseen_cards[0])
+        new_item = _cards_to_items(unseen_cards[:1], self.session_direction, self.progress)[0]
         new_item["intro_new"] = True
         self.session_items.append(new_item)
+        self._session_items_by_id.setdefault(new_item["id"], new_item)
         self._pending_new_card = new_item
 
     def _start_timer(self) -> None:
@@ -2795,30 +3148,44 @@ class JonMemApp(App):
 
     def _tick(self, _dt):
         self.time_left -= 1
-        self.update_training_view()
+        if self.sm.current == "train":
+            self._update_timer_label()
+            self._update_answer_focus()
         if self.time_left <= 0:
             self.end_training(cancelled=False)
 
     def update_training_view(self):
         if self.sm.current != "train":
             return
-        mins = max(0, self.time_left) // 60
-        secs = max(0, self.time_left) % 60
+        self._update_timer_label()
+        self._update_card_view()
+        self._update_answer_focus()
+
+    def _update_timer_label(self) -> None:
+        mins, secs = divmod(max(0, self.time_left), 60)
         self.screen_train.timer_label.text = f"{mins:02d}:{secs:02d}"
+
+    def _update_card_view(self) -> None:
         if self.session_index < len(self.session_items):
             item = self.session_items[self.session_index]
-            self.screen_train.prompt_label.text = item.get("prompt", "")
             level = int(item.get("stage", 1) or 1)
-            topic_name = self.get_topic_name(item.get("topic"), self.session_lang)
-            self.screen_train.category_label.text = f"Kategorie: {topic_name or '-'}"
-            self.screen_train.level_label.text = f"Level {level}"
-            self.screen_train._card_color.rgba = _level_bg_color(level)
+            view_key = (self.session_index, item.get("id"), level)
+            if view_key != self._last_view_key:
+                self._last_view_key = view_key
+                self.screen_train.prompt_label.text = item.get("prompt", "")
+                topic_name = self.get_topic_name(item.get("topic"), self.session_lang)
+                self.screen_train.category_label.text = f"Kategorie: {topic_name or '-'}"
+                self.screen_train.level_label.text = f"Level {level}"
+                self.screen_train._card_color.rgba = _level_bg_color(level)
         else:
+            self._last_view_key = None
             self.screen_train.prompt_label.text = ""
             self.screen_train.category_label.text = "Kategorie: -"
             self.screen_train.level_label.text = "Level 1"
             self.screen_train._card_color.rgba = CARD_BG
         self.screen_train.pyramid_button.disabled = (self.session_mode == "exam")
+
+    def _update_answer_focus(self) -> None:
         if self.session_index < len(self.session_items):
             if self.screen_train._last_focus_index != self.session_index:
                 self.screen_train._last_focus_index = self.session_index
@@ -2846,13 +3213,12 @@ class JonMemApp(App):
                     "correct": expected,
                 })
             self._record_session_answer(item, text, correct, stage_before, stage_before, 1)
-            if self._timer_event is not None:
-                self._timer_event.cancel()
-                self._timer_event = None
-            self._show_answer_popup(item, correct, given_text=text)
-            self.screen_train.answer_input.text = ""
+            self._finish_answer(item, correct, text)
             return
-        analysis = training.analyze_answer(text, expected)
+        prepared = item.get("answer_prepared")
+        if prepared is None:
+            prepared = item["answer_prepared"] = training.prepare_expected(expected)
+        analysis = training.analyze_prepared(text, prepared)
         level = int(item.get("stage", 1) or 1)
 
         if self._second_chance_active and self._second_chance_item_id == item.get("id"):
@@ -2871,15 +3237,9 @@ class JonMemApp(App):
                 self._sync_session_item_stage(item["id"], new_stage)
                 self._record_session_answer(item, text, False, prev_stage, new_stage, 2)
 
-            # Pause timer while showing feedback
-            if self._timer_event is not None:
-                self._timer_event.cancel()
-                self._timer_event = None
-
             self._second_chance_active = False
             self._second_chance_item_id = None
-            self._show_answer_popup(item, correct, given_text=text)
-            self.screen_train.answer_input.text = ""
+            self._finish_answer(item, correct, text)
             return
 
         if analysis.get("correct", False):
@@ -2891,114 +3251,105 @@ class JonMemApp(App):
             self._record_session_answer(item, text, True, prev_stage, new_stage, 1)
             if self.session_mode == "introduce" and prev_stage == 1 and new_stage == 2:
                 self._queue_new_intro_card()
-
-            # Pause timer while showing feedback
-            if self._timer_event is not None:
-                self._timer_event.cancel()
-                self._timer_event = None
-
-            self._show_answer_popup(item, True)
-            self.screen_train.answer_input.text = ""
+            self._finish_answer(item, True)
             return
 
-        second_chance, hint_lines = self._second_chance_hint(level, analysis, expected)
+        second_chance, hint_lines = self._second_chance_hint(level, analysis, prepared["chars"])
         if second_chance:
             self._second_chance_active = True
             self._second_chance_item_id = item.get("id")
             if self._sound_almost is not None:
                 self._sound_almost.play()
-
-            # Pause timer while showing feedback
-            if self._timer_event is not None:
-                self._timer_event.cancel()
-                self._timer_event = None
-
+            self._pause_timer()
             self._show_second_chance_popup(hint_lines)
             return
 
         prev_stage, new_stage = self._update_progress(item["id"], False)
         self._sync_session_item_stage(item["id"], new_stage)
         self._record_session_answer(item, text, False, prev_stage, new_stage, 1)
+        self._finish_answer(item, False, text)
 
-        # Pause timer while showing feedback
-        if self._timer_event is not None:
-            self._timer_event.cancel()
+    def _pause_timer(self) -> None:
+        event = self._timer_event
+        if event is not None:
+            event.cancel()
             self._timer_event = None
 
-        self._show_answer_popup(item, False, given_text=text)
+    def _finish_answer(self, item: dict, correct: bool, given_text: str = "") -> None:
+        # Pause timer while showing feedback
+        self._pause_timer()
+        self._show_answer_popup(item, correct, given_text=given_text)
         self.screen_train.answer_input.text = ""
 
+    def _build_answer_popup(self) -> None:
+        layout = BoxLayout(orientation="vertical", spacing=_ui(6), padding=_ui(10))
+        self._ap_status = _styled_label("", markup=True, font_size=_ui(BASE_LABEL_FONT_SIZE + 4), halign="left")
+        self._ap_given = _styled_label("", markup=True, halign="left")
+        self._ap_de = _styled_label("", halign="left")
+        self._ap_en = _styled_label("", halign="left")
+        self._ap_hint_input = hint_input = _styled_text_input(multiline=True, size_hint_y=None, height=_ui(110))
+        self._ap_hints = _styled_label("", halign="left")
+        for widget in (self._ap_status, self._ap_given, self._ap_de, self._ap_en,
+                       _styled_label("Eselsbrücke (für diese Richtung)", halign="left"),
+                       hint_input, self._ap_hints):
+            layout.add_widget(widget)
+        layout.add_widget(Button(text="OK", size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT),
+                                 on_release=self._answer_popup_next))
+        popup = _styled_popup(title="Lösung", content=_make_scrollable(layout), size_hint=(0.92, 0.85))
+        popup.bind(on_dismiss=lambda *_: self._store_answer_hint())
+        hint_input.bind(
+            focus=lambda _inp, focused: Clock.schedule_once(lambda *_: _scroll_to_widget(hint_input), 0.05)
+            if focused else None
+        )
+        popup.bind(on_open=lambda *_: Clock.schedule_once(lambda *_: _scroll_to_widget(hint_input), 0.05))
+        self._answer_popup = popup
+
     def _show_answer_popup(self, item: dict, correct: bool, given_text: str = "") -> None:
-        status = "Richtig" if correct else "Falsch"
-        color = "00cc66" if correct else "ff4444"
-        de_text = item.get("de", "")
-        en_text = item.get("en", "")
-        hint_de = item.get("hint_de_to_en", "")
-        hint_en = item.get("hint_en_to_de", "")
-        direction = self.session_direction or "de_to_en"
-        hint_key = training.hint_key(direction)
+        hint_key = training.hint_key(self.session_direction or "de_to_en")
         current_hint = item.get(hint_key, "")
         if not current_hint:
             card = self._get_card_by_id(item.get("id"))
             if card:
                 current_hint = card.get(hint_key, "")
 
-        layout = BoxLayout(orientation="vertical", spacing=_ui(6), padding=_ui(10))
-        layout.add_widget(_styled_label(
-            f"[color={color}]{status}[/color]",
-            markup=True,
-            font_size=_ui(BASE_LABEL_FONT_SIZE + 4),
-            halign="left",
-        ))
-        if not correct and given_text:
-            safe_given = escape_markup(given_text)
-            layout.add_widget(_styled_label(
-                f"Deine Eingabe: [s]{safe_given}[/s]",
-                markup=True,
-                halign="left",
-            ))
-        layout.add_widget(_styled_label(f"Deutsch: {de_text}", halign="left"))
-        lang = (self.session_lang or "en").upper()
-        layout.add_widget(_styled_label(f"Zielsprache ({lang}): {en_text}", halign="left"))
-        layout.add_widget(_styled_label("Eselsbrücke (für diese Richtung)", halign="left"))
-        hint_input = _styled_text_input(text=current_hint, multiline=True, size_hint_y=None, height=_ui(110))
-        layout.add_widget(hint_input)
-        if hint_de:
-            layout.add_widget(_styled_label(f"Eselsbrücke DE → ZS: {hint_de}", halign="left"))
-        if hint_en:
-            layout.add_widget(_styled_label(f"Eselsbrücke ZS → DE: {hint_en}", halign="left"))
-
-        def _store_hint():
-            cleaned = (hint_input.text or "").strip()
-            self._save_card_hint(item.get("id"), direction, cleaned)
-            item[hint_key] = cleaned
-            item["hint"] = cleaned
-
-        def _next(_):
-            _store_hint()
-            popup.dismiss()
-            self.session_index += 1
-            if self.session_index >= len(self.session_items):
-                self.end_training(cancelled=False)
-            else:
-                if self._pending_new_card is not None:
-                    pending = self._pending_new_card
-                    self._pending_new_card = None
-                    self._show_new_card_popup(pending, resume_timer=True)
-                else:
-                    self._start_timer()
-                    self.update_training_view()
-
-        layout.add_widget(Button(text="OK", size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT), on_release=_next))
-        scroll = _make_scrollable(layout)
-        popup = _styled_popup(title="Lösung", content=scroll, size_hint=(0.92, 0.85))
-        popup.bind(on_dismiss=lambda *_: _store_hint())
-        hint_input.bind(
-            focus=lambda _inp, focused: Clock.schedule_once(lambda *_: _scroll_to_widget(hint_input), 0.05)
-            if focused else None
-        )
-        popup.bind(on_open=lambda *_: Clock.schedule_once(lambda *_: _scroll_to_widget(hint_input), 0.05))
-        popup.open()
+        if self._answer_popup is None:
+            self._build_answer_popup()
+        self._answer_item = item
+        self._ap_status.text = "[color=00cc66]Richtig[/color]" if correct else "[color=ff4444]Falsch[/color]"
+        _set_label_visible(self._ap_given, not correct and bool(given_text),
+                           f"Deine Eingabe: [s]{escape_markup(given_text)}[/s]")
+        self._ap_de.text = f"Deutsch: {item.get('de', '')}"
+        self._ap_en.text = self._lang_prefix + item.get("en", "")
+        self._ap_hint_input.text = current_hint
+        hint_text = _card_hint_text(item)
+        _set_label_visible(self._ap_hints, bool(hint_text), hint_text)
+        self._answer_popup.open()
+
+    def _store_answer_hint(self) -> None:
+        item = self._answer_item
+        if item is None:
+            return
+        direction = self.session_direction or "de_to_en"
+        hint_key = training.hint_key(direction)
+        cleaned = (self._ap_hint_input.text or "").strip()
+        self._save_card_hint(item.get("id"), direction, cleaned)
+        item[hint_key] = cleaned
+        item["hint"] = cleaned
+
+    def _answer_popup_next(self, *_) -> None:
+        self._store_answer_hint()
+        self._answer_popup.dismiss()
+        self._answer_item = None
+        self.session_index += 1
+        if self.session_index >= len(self.session_items):
+            self.end_training(cancelled=False)
+        elif self._pending_new_card is not None:
+            pending = self._pending_new_card
+            self._pending_new_card = None
+            self._show_new_card_popup(pending, resume_timer=True)
+        else:
+            self._start_timer()
+            self.update_training_view()
 
     def _show_second_chance_popup(self, hint_lines: list[str]) -> None:
         layout = BoxLayout(orientation="vertical", spacing=_ui(6), padding=_ui(10))
@@ -3014,63 +3365,52 @@ class JonMemApp(App):
         popup = _styled_popup(title="Fast richtig....", content=layout, size_hint=(0.8, 0.4))
         popup.open()
 
-    def _show_new_card_popup(self, item: dict, *, resume_timer: bool) -> None:
+    def _build_new_card_popup(self) -> None:
+        layout = BoxLayout(orientation="vertical", spacing=_ui(6), padding=_ui(10))
+        self._nc_de = Label()
+        self._nc_en = Label()
+        self._nc_hints = Label(halign="center")
+        for widget in (self._nc_de, self._nc_en, self._nc_hints):
+            layout.add_widget(widget)
+        layout.add_widget(Button(text="OK", size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT),
+                                 on_release=lambda *_: self._new_card_on_close()))
+        popup = _styled_popup(title="Neue Karte!", content=layout, size_hint=(0.9, 0.7))
+        popup.bind(on_open=lambda *_: setattr(self, "_new_card_open", True),
+                   on_dismiss=lambda *_: setattr(self, "_new_card_open", False))
+        self._new_card_popup = popup
+
+    def _present_new_card(self, item: dict, on_close) -> None:
         if self._sound_new_card is not None:
             self._sound_new_card.play()
-        de_text = item.get("de", "")
-        en_text = item.get("en", "")
-        hint_de = item.get("hint_de_to_en", "")
-        hint_en = item.get("hint_en_to_de", "")
+        if self._new_card_popup is None:
+            self._build_new_card_popup()
+        self._nc_de.text = f"Deutsch: {item.get('de', '')}"
+        self._nc_en.text = self._lang_prefix + item.get("en", "")
+        hint_text = _card_hint_text(item)
+        _set_label_visible(self._nc_hints, bool(hint_text), hint_text)
+        self._new_card_on_close = on_close
+        if not self._new_card_open:
+            self._new_card_popup.open()
 
-        layout = BoxLayout(orientation="vertical", spacing=_ui(6), padding=_ui(10))
-        layout.add_widget(Label(text=f"Deutsch: {de_text}"))
-        lang = (self.session_lang or "en").upper()
-        layout.add_widget(Label(text=f"Zielsprache ({lang}): {en_text}"))
-        if hint_de:
-            layout.add_widget(Label(text=f"Eselsbrücke DE → ZS: {hint_de}"))
-        if hint_en:
-            layout.add_widget(Label(text=f"Eselsbrücke ZS → DE: {hint_en}"))
-
-        def _close(_):
-            popup.dismiss()
+    def _show_new_card_popup(self, item: dict, *, resume_timer: bool) -> None:
+        def _close():
+            self._new_card_popup.dismiss()
             if resume_timer:
                 self._start_timer()
                 self.update_training_view()
 
-        layout.add_widget(Button(text="OK", size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT), on_release=_close))
-        popup = _styled_popup(title="Neue Karte!", content=layout, size_hint=(0.9, 0.7))
-        popup.open()
+        self._present_new_card(item, _close)
 
     def _show_next_intro_card(self) -> None:
         if not self._intro_queue:
+            if self._new_card_open:
+                self._new_card_popup.dismiss()
             self._start_timer()
             self.update_training_view()
             return
-        item = self._intro_queue.pop(0)
-
-        def _after_close(_):
-            popup.dismiss()
-            self._show_next_intro_card()
-
-        if self._sound_new_card is not None:
-            self._sound_new_card.play()
-        de_text = item.get("de", "")
-        en_text = item.get("en", "")
-        hint_de = item.get("hint_de_to_en", "")
-        hint_en = item.get("hint_en_to_de", "")
-        layout = BoxLayout(orientation="vertical", spacing=_ui(6), padding=_ui(10))
-        layout.add_widget(Label(text=f"Deutsch: {de_text}"))
-        lang = (self.session_lang or "en").upper()
-        layout.add_widget(Label(text=f"Zielsprache ({lang}): {en_text}"))
-        if hint_de:
-            layout.add_widget(Label(text=f"Eselsbrücke DE → ZS: {hint_de}"))
-        if hint_en:
-            layout.add_widget(Label(text=f"Eselsbrücke ZS → DE: {hint_en}"))
-        layout.add_widget(Button(text="OK", size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT), on_release=_after_close))
-        popup = _styled_popup(title="Neue Karte!", content=layout, size_hint=(0.9, 0.7))
-        popup.open()
+        self._present_new_card(self._intro_queue.popleft(), self._show_next_intro_card)
 
-    def _second_chance_hint(self, level: int, analysis: dict, expected: str) -> tuple[bool, list[str]]:
+    def _second_chance_hint(self, level: int, analysis: dict, expected_chars: frozenset) -> tuple[bool, list[str]]:
         if level >= 4:
             return False, []
         if not analysis.get("given_norm") or not analysis.get("expected_norm"):
@@ -3101,13 +3441,13 @@ class JonMemApp(App):
             hints.append("guck noch mal genau")
 
         if accent_errors > 0:
-            if "ñ" in expected or "Ñ" in expected:
+            if "ñ" in expected_chars or "Ñ" in expected_chars:
                 hints.append("Achte auf die Tilde über dem n.")
             else:
                 hints.append("Achte auf die Akzente.")
 
         if punct_errors > 0:
-            if any(ch in expected for ch in ("'", "’", "´")):
+            if not _APOSTROPHES.isdisjoint(expected_chars):
                 hints.append("Achte auf das Apostroph.")
             else:
                 hints.append("Achte auf die Satzzeichen.")
@@ -3129,7 +3469,8 @@ class JonMemApp(App):
         dir_entry["stage"] = new_stage
         dir_entry["last_seen"] = datetime.now().isoformat(timespec="seconds")
         dir_entry["last_result"] = bool(correct)
-        _save_json(self.progress_path, self.progress)
+        self._seen_ids_for(self.session_direction).add(card_id)
+        self._save_progress()
         return stage, new_stage
 
     def _sync_session_item_stage(self, card_id: str, new_stage: int) -> None:
@@ -3165,29 +3506,34 @@ class JonMemApp(App):
             "meta": meta,
             "items": list(self._session_log_entries),
         }
-        _save_json(self.last_session_log_path, self.last_session_log)
+        backup_io.save_json_file(self.last_session_log_path, self.last_session_log)
 
     def end_training(self, cancelled: bool) -> None:
-        if self._timer_event is not None:
-            self._timer_event.cancel()
-            self._timer_event = None
+        self._pause_timer()
         if cancelled:
             self._finalize_session_log(cancelled=True)
+            self.session_items = []
+            self._session_items_by_id = {}
+            self._flush_pending_saves()
             self.sm.current = "menu"
             return
         if self.session_mode == "introduce" and self.time_left <= 0:
             changed = False
-            seen_ids = {item.get("id") for item in self.session_items if item.get("id")}
-            for card_id in seen_ids:
-                entry = self.progress.get(card_id, {})
-                dir_entry = entry.get(self.session_direction)
+            direction = self.session_direction
+            seen = self._seen_ids_for(direction)
+            for card_id in self._session_items_by_id:
+                entry = self.progress.get(card_id)
+                if not entry:
+                    continue
+                dir_entry = entry.get(direction)
                 if dir_entry and int(dir_entry.get("stage", 1)) == 1:
-                    entry.pop(self.session_direction, None)
+                    del entry[direction]
+                    seen.discard(card_id)
                     changed = True
-                if entry == {}:
-                    self.progress.pop(card_id, None)
+                    if not entry:
+                        del self.progress[card_id]
             if changed:
-                _save_json(self.progress_path, self.progress)
+                self._save_progress()
         total = len(self.session_items)
         summary = f"{self.session_correct} von {total} richtig."
         if self.session_mode != "exam":
@@ -3208,34 +3554,40 @@ class JonMemApp(App):
         else:
             _styled_popup(title="Training", content=Label(text=summary), size_hint=(0.6, 0.4)).open()
         self._finalize_session_log(cancelled=False)
+        self.session_items = []
+        self._session_items_by_id = {}
+        self._flush_pending_saves()
         self.sm.current = "menu"
 
     def show_session_pyramid(self) -> None:
-        if not self.session_items:
+        if not self._session_items_by_id:
             _styled_popup(title="Pyramide", content=Label(text="Keine Session aktiv."), size_hint=(0.6, 0.3)).open()
             return
-        stages = {i: [] for i in range(1, MAX_STAGE + 1)}
-        seen_ids = set()
-        for item in self.session_items:
-            item_id = item.get("id")
-            if not item_id or item_id in seen_ids:
-                continue
-            seen_ids.add(item_id)
-            prog = self.progress.get(item["id"], {}).get(self.session_direction, {})
+        stages = [[] for _ in range(MAX_STAGE)]
+        for item_id, item in self._session_items_by_id.items():
+            prog = self.progress.get(item_id, _EMPTY).get(self.session_direction, _EMPTY)
             stage = int(prog.get("stage", 1))
-            stages.setdefault(stage, []).append(item.get("prompt", ""))
-
-        layout = BoxLayout(orientation="vertical", spacing=_ui(6), padding=_ui(10))
-        scroll = ScrollView()
-        inner = BoxLayout(orientation="vertical", size_hint_y=None, spacing=_ui(4))
-        inner.bind(minimum_height=inner.setter("height"))
+            stages[min(max(stage, 1), MAX_STAGE) - 1].append(item.get("prompt", ""))
 
+        header_height = _ui(24)
+        row_height = _ui(22)
+        data = []
         for stage in range(MAX_STAGE, 0, -1):
-            inner.add_widget(Label(text=f"Stufe {stage}", size_hint_y=None, height=_ui(24), bold=True))
-            for prompt in stages.get(stage, []):
-                inner.add_widget(Label(text=f"• {prompt}", size_hint_y=None, height=_ui(22), halign="left"))
-        scroll.add_widget(inner)
-        layout.add_widget(scroll)
+            prompts = stages[stage - 1]
+            if not prompts:
+                continue
+            data.append({"text": f"Stufe {stage}", "height": header_height, "bold": True})
+            data.extend({"text": f"• {prompt}", "height": row_height, "bold": False} for prompt in prompts)
+
+        layout = BoxLayout(orientation="vertical", spacing=_ui(6), padding=_ui(10))
+        rv = RecycleView(do_scroll_x=False)
+        rv.viewclass = "Label"
+        rows = RecycleBoxLayout(orientation="vertical", spacing=_ui(4), size_hint_y=None,
+                                default_size=(None, row_height), default_size_hint=(1, None))
+        rows.bind(minimum_height=rows.setter("height"))
+        rv.add_widget(rows)
+        rv.data = data
+        layout.add_widget(rv)
         layout.add_widget(Button(text="Schließen", size_hint_y=None, height=_ui(BASE_BUTTON_HEIGHT),
                                  on_release=lambda *_: popup.dismiss()))
         popup = _styled_popup(title="Pyramide der Session", content=layout, size_hint=(0.9, 0.9))
@@ -3250,26 +3602,20 @@ class JonMemApp(App):
             "direction": self.session_direction,
         }
         self.training_log.append(entry)
-        _save_json(self.log_path, self.training_log)
+        try:
+            backup_io.append_jsonl(self.log_path, entry)
+        except Exception as exc:
+            self._log_error("training log save failed", exc)
+        if self._counts_cache is not None:
+            _add_training_count(self._counts_cache, entry)
 
     def training_counts_by_day(self):
-        counts = {}
-        for entry in self.training_log:
-            try:
-                day = entry.get("started", "")[:10]
-            except Exception:
-                continue
-            if not day:
-                continue
-            day_entry = counts.setdefault(day, {"introduce": 0, "review": 0})
-            mode = entry.get("mode")
-            if mode == "introduce":
-                day_entry["introduce"] += 1
-            elif mode == "review":
-                day_entry["review"] += 1
-            else:
-                day_entry["review"] += 1
-        return counts
+        if self._counts_cache is None:
+            counts = {}
+            for entry in self.training_log:
+                _add_training_count(counts, entry)
+            self._counts_cache = counts
+        return self._counts_cache
 
     def _grade_from_percent(self, percent: float) -> int:
         if percent >= 92:
@@ -3301,7 +3647,7 @@ class JonMemApp(App):
             "wrong": list(self.exam_wrong),
         }
         self.exam_log.append(entry)
-        _save_json(self.exam_log_path, self.exam_log)
+        backup_io.save_json_file(self.exam_log_path, self.exam_log)
         self.show_exam_result_popup(entry)
 
     def get_exam_results_for_month(self, year: int, month: int) -> list[dict]:
@@ -3332,6 +3678,7 @@ class JonMemApp(App):
         layout.add_widget(Label(text=f"Ergebnis: {correct}/{total} ({percent}%)"))
         layout.add_widget(Label(text=f"Note: {grade}"))
 
+        from kivy.uix.gridlayout import GridLayout
         table = GridLayout(cols=3, spacing=_ui(6), size_hint_y=None)
         table.bind(minimum_height=table.setter("height"))
         table.add_widget(Label(text="Wort", bold=True, size_hint_y=None, height=_ui(24)))
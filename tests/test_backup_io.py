@@ -1,3 +1,6 @@
+import io
+import json
+
 import pytest
 
 import backup_io
@@ -17,8 +20,8 @@ def _make_payload():
 
 def test_backup_export_import_roundtrip():
     payload = _make_payload()
-    raw = backup_io.dump_payload_to_yaml_bytes(payload)
-    loaded = backup_io.load_payload_from_yaml_bytes(raw)
+    raw = backup_io.dump_payload_bytes(payload)
+    loaded = backup_io.load_payload_bytes(raw)
     normalized = backup_io.normalize_backup_payload(loaded)
     assert normalized["vocab"] == payload["vocab"]
     assert normalized["progress"] == payload["progress"]
@@ -26,6 +29,18 @@ def test_backup_export_import_roundtrip():
     assert normalized["exam_log"] == payload["exam_log"]
 
 
+def test_backup_format_follows_extension(tmp_path):
+    payload = _make_payload()
+    assert backup_io.dump_payload_bytes(payload).startswith(b"{")
+    yaml_raw = backup_io.dump_payload_bytes(payload, "backup.yaml")
+    assert not yaml_raw.startswith(b"{")
+    assert backup_io.load_payload_bytes(yaml_raw)["vocab"] == payload["vocab"]
+
+    legacy_path = tmp_path / f"legacy{backup_io.BACKUP_EXT}"
+    legacy_path.write_bytes(yaml_raw)
+    assert backup_io.load_payload_from_path(str(legacy_path))["progress"] == payload["progress"]
+
+
 def test_scan_backup_payload_counts():
     payload = _make_payload()
     scan = backup_io.scan_backup_payload(payload)
@@ -39,6 +54,8 @@ def test_ensure_backup_extension():
     assert backup_io.ensure_backup_extension("backup") == f"backup{backup_io.BACKUP_EXT}"
     assert backup_io.ensure_backup_extension("backup.yaml") == "backup.yaml"
     assert backup_io.ensure_backup_extension(f"backup{backup_io.BACKUP_EXT}") == f"backup{backup_io.BACKUP_EXT}"
+    assert backup_io.ensure_backup_extension("old.v2/BACKUP.YML") == "old.v2/BACKUP.YML"
+    assert backup_io.ensure_backup_extension("dir.yaml/backup") == f"dir.yaml/backup{backup_io.BACKUP_EXT}"
 
 
 def test_rollback_restore_after_failed_persist(tmp_path):
@@ -87,3 +104,144 @@ def test_rollback_restore_after_failed_persist(tmp_path):
     assert restored["progress"] == old_payload["progress"]
     assert restored["training_log"] == old_payload["training_log"]
     assert restored["exam_log"] == old_payload["exam_log"]
+
+
+def test_load_payload_bytes_tolerates_invalid_utf8():
+    raw = b"vocab:\n  meta:\n    note: caf\xe9\n"
+    data = backup_io.load_payload_bytes(raw)
+    assert data["vocab"]["meta"]["note"] == "caf�"
+
+
+def test_persist_payload_to_file_leaves_no_temp_files(tmp_path):
+    path = tmp_path / f"backup{backup_io.BACKUP_EXT}"
+    backup_io.persist_payload_to_file(str(path), _make_payload())
+    backup_io.persist_payload_to_file(str(path), _make_payload())
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
+    assert backup_io.load_payload_from_path(str(path))["exam_log"] == _make_payload()["exam_log"]
+
+
+def test_normalize_backup_payload_fills_missing_sections():
+    payload = _make_payload()
+    assert backup_io.normalize_backup_payload(payload) is payload
+
+    partial = {"vocab": {"cards": [], "meta": "broken"}}
+    normalized = backup_io.normalize_backup_payload(partial)
+    assert normalized["vocab"] == {"meta": {}, "topics": [], "cards": []}
+    assert normalized["progress"] == {}
+    assert normalized["training_log"] == []
+
+
+def test_load_payload_from_path_returns_independent_copies(tmp_path):
+    path = tmp_path / "backup.yaml"
+    backup_io.persist_payload_to_file(str(path), _make_payload())
+
+    first = backup_io.load_payload_from_path(str(path))
+    first["vocab"]["cards"].clear()
+    second = backup_io.load_payload_from_path(str(path))
+    assert second["vocab"]["cards"] == _make_payload()["vocab"]["cards"]
+
+    changed = _make_payload()
+    changed["exam_log"].append({"grade": 2})
+    backup_io.persist_payload_to_file(str(path), changed)
+    assert backup_io.load_payload_from_path(str(path))["exam_log"] == changed["exam_log"]
+
+
+def test_persist_payload_to_files_skips_unchanged_files(tmp_path):
+    paths = {
+        "vocab_path": str(tmp_path / "vocab.yaml"),
+        "progress_path": str(tmp_path / "progress.json"),
+        "training_log_path": str(tmp_path / "training_log.json"),
+        "exam_log_path": str(tmp_path / "exam_log.json"),
+    }
+    payload = _make_payload()
+    payload["exam_log"] = []
+    backup_io.persist_payload_to_files(payload, **paths)
+    assert (tmp_path / "exam_log.json").read_bytes() == b"[]"
+    inodes = {name: (tmp_path / name).stat().st_ino for name in ("vocab.yaml", "exam_log.json")}
+
+    payload["progress"]["c2"] = {"de_to_en": {"stage": 1}}
+    backup_io.persist_payload_to_files(payload, **paths)
+    assert {name: (tmp_path / name).stat().st_ino for name in inodes} == inodes
+    assert backup_io.load_payload_from_files(**paths)["progress"] == payload["progress"]
+
+
+def test_scan_backup_payload_rejects_invalid_payload():
+    with pytest.raises(ValueError):
+        backup_io.scan_backup_payload({"vocab": {"cards": "nope"}})
+
+
+def test_persist_payload_to_files_vocab_format_follows_extension(tmp_path):
+    paths = {
+        "vocab_path": str(tmp_path / "vocab.json"),
+        "progress_path": str(tmp_path / "progress.json"),
+        "training_log_path": str(tmp_path / "training_log.json"),
+        "exam_log_path": str(tmp_path / "exam_log.json"),
+    }
+    payload = _make_payload()
+    backup_io.persist_payload_to_files(payload, **paths)
+    assert json.loads((tmp_path / "vocab.json").read_bytes()) == payload["vocab"]
+    assert backup_io.load_payload_from_files(**paths)["vocab"] == payload["vocab"]
+
+
+@pytest.mark.parametrize("streams", [True, False])
+def test_write_payload_yaml_matches_dump(monkeypatch, streams):
+    monkeypatch.setattr(backup_io, "_YAML_STREAMS", streams)
+    payload = _make_payload()
+    handle = io.BytesIO()
+    backup_io.write_payload(handle, payload, "backup.yaml")
+    assert handle.getvalue() == backup_io.dump_payload_bytes(payload, "backup.yaml")
+
+
+def test_persist_payload_to_files_writes_jsonl_training_log(tmp_path):
+    paths = {
+        "vocab_path": str(tmp_path / "vocab.json"),
+        "progress_path": str(tmp_path / "progress.json"),
+        "training_log_path": str(tmp_path / "training_log.jsonl"),
+        "exam_log_path": str(tmp_path / "exam_log.json"),
+    }
+    payload = _make_payload()
+    payload["training_log"].append({"started": "2026-01-02T10:00:00", "mode": "introduce"})
+    backup_io.persist_payload_to_files(payload, **paths)
+    lines = (tmp_path / "training_log.jsonl").read_bytes().splitlines()
+    assert [json.loads(line) for line in lines] == payload["training_log"]
+    assert backup_io.load_payload_from_files(**paths)["training_log"] == payload["training_log"]
+
+
+def test_apply_vocab_journal_replays_edits():
+    vocab = _make_payload()["vocab"]
+    entries = [
+        {"op": "topic", "topic": {"id": "t2", "lang": "en", "name": "Food"}},
+        {"op": "topic", "topic": {"id": "t1", "lang": "en", "name": "Basics"}},
+        {"op": "card", "card": {"id": "c2", "lang": "en", "topic": "t2", "de": "Brot", "en": "bread"}},
+        {"op": "card", "card": {"id": "c1", "lang": "en", "topic": "t1", "de": "Haus", "en": "home"}},
+        {"op": "delete", "id": "c2"},
+        {"op": "meta", "meta": {"target_langs": ["en"]}},
+        {"op": "unknown"},
+        "garbage",
+    ]
+    assert backup_io.apply_vocab_journal(vocab, entries) == 5
+    assert [topic["id"] for topic in vocab["topics"]] == ["t1", "t2"]
+    assert vocab["cards"] == [{"id": "c1", "lang": "en", "topic": "t1", "de": "Haus", "en": "home"}]
+    assert vocab["meta"] == {"target_langs": ["en"]}
+
+
+def test_jsonl_file_helpers_skip_corrupt_lines(tmp_path):
+    path = str(tmp_path / "log.jsonl")
+    assert backup_io.load_jsonl_file(path, []) == []
+    backup_io.save_jsonl_file(path, [{"a": 1}])
+    with open(path, "ab") as handle:
+        handle.write(b"{broken\n")
+    backup_io.append_jsonl(path, {"b": 2})
+    assert backup_io.load_jsonl_file(path, []) == [{"a": 1}, {"b": 2}]
+    assert [p.name for p in tmp_path.iterdir()] == ["log.jsonl"]
+
+
+@pytest.mark.parametrize(("path", "expected"), [
+    ("backup.yaml", True),
+    ("backup.YML", True),
+    (f"backup{backup_io.BACKUP_EXT}", False),
+    ("", False),
+    (None, False),
+])
+def test_is_yaml_backup_path(path, expected):
+    assert backup_io.is_yaml_backup_path(path) is expected
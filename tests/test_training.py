@@ -103,3 +103,27 @@ def test_analyze_answer_accents_and_punct():
 
     analysis = training.analyze_answer("lami", "l'ami")
     assert analysis["punct_errors"] >= 1
+
+
+def test_levenshtein_matches_dp():
+    rng = random.Random(7)
+    for _ in range(500):
+        a = "".join(rng.choice("abñé '") for _ in range(rng.randint(1, 70)))
+        b = "".join(rng.choice("abñé '") for _ in range(rng.randint(1, 70)))
+        assert training._levenshtein_py(a, b) == training._levenshtein_dp(a, b)
+    assert training._levenshtein_py("", "abc") == 3
+    assert training.levenshtein("kitten", "sitting") == 3
+
+
+def test_analyze_prepared_matches_analyze_answer():
+    prepared = training.prepare_expected("l'ami  de niño")
+    for given in ("l'ami de niño", "lami de nino", "L'ami de niño", "l'ami", ""):
+        assert training.analyze_prepared(given, prepared) == training.analyze_answer(given, "l'ami  de niño")
+
+
+def test_shuffle_avoid_adjacent_separates_repeats():
+    unique = [_make_card(f"c{i}", lang="en", topic="t1") for i in range(5)]
+    session = unique * 2 + [unique[0]]
+    result = training.shuffle_avoid_adjacent(list(session), "id", random.Random(3))
+    assert sorted(item["id"] for item in result) == sorted(item["id"] for item in session)
+    assert all(result[i]["id"] != result[i - 1]["id"] for i in range(1, len(result)))
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import array
+import math
+import os
+import sys
+import wave
+
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    np = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOUNDS_DIR = os.path.join(ROOT, "data", "sounds")
+FRAMERATE = 44100
+
+BEEPS = {
+    "success.wav": (880.0, 0.12),
+    "almost.wav": (660.0, 0.12),
+    "new_card.wav": (520.0, 0.14),
+}
+
+
+def write_beep(path: str, *, freq: float, duration: float) -> None:
+    samples = int(FRAMERATE * duration)
+    if np is not None:
+        t = np.arange(samples, dtype=np.float64) / FRAMERATE
+        frames = (32767 * 0.5 * np.sin(2 * np.pi * freq * t)).astype("<i2").tobytes()
+    else:
+        step = 2 * math.pi * freq / FRAMERATE
+        sin = math.sin
+        data = array.array("h", [int(16383.5 * sin(step * i)) for i in range(samples)])
+        if sys.byteorder != "little":
+            data.byteswap()
+        frames = data.tobytes()
+    with wave.open(path, "w") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(FRAMERATE)
+        wav.writeframes(frames)
+
+
+def main() -> int:
+    os.makedirs(SOUNDS_DIR, exist_ok=True)
+    for name, (freq, duration) in BEEPS.items():
+        path = os.path.join(SOUNDS_DIR, name)
+        write_beep(path, freq=freq, duration=duration)
+        print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import glob
+import json
+import os
+import sys
+
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, "data")
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def precompile(path: str) -> str:
+    with open(path, "rb") as handle:
+        data = yaml.load(handle, Loader=Loader) or {}
+    if not isinstance(data, dict):
+        raise ValueError(f"invalid yaml structure: {path}")
+    target = f"{path}.json"
+    with open(target, "wb") as handle:
+        handle.write(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    return target
+
+
+def main(argv: list[str]) -> int:
+    paths = argv or sorted(glob.glob(os.path.join(DATA_DIR, "*.yaml")))
+    for path in paths:
+        print(precompile(path))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
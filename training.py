@@ -1,10 +1,40 @@
 from __future__ import annotations
 
+import heapq
 import random
 import unicodedata
 from typing import Iterable
 from datetime import datetime
 
+try:
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein  # type: ignore
+except Exception:
+    _rf_levenshtein = None
+
+EMPTY: dict = {}
+
+
+class CharFilter(dict):
+    # str.translate table that keeps characters matching `keep`, filled lazily per code point.
+    def __init__(self, keep, fixed=()):
+        super().__init__(fixed)
+        self.keep = keep
+
+    def __missing__(self, code: int):
+        ch = chr(code)
+        value = self[code] = ch if self.keep(ch) else None
+        return value
+
+
+def _is_punct(ch: str) -> bool:
+    return unicodedata.category(ch).startswith("P")
+
+
+_ALNUM = CharFilter(str.isalnum)
+_ALNUM_OR_SPACE = CharFilter(lambda ch: ch.isalnum() or ch.isspace())
+_PUNCT = CharFilter(_is_punct)
+_NO_MARKS = CharFilter(lambda ch: unicodedata.category(ch) != "Mn")
+
 
 def normalize_spaces(text: str) -> str:
     if not isinstance(text, str):
@@ -16,19 +46,15 @@ def normalize_text(text: str) -> str:
     if not isinstance(text, str):
         return ""
     text = normalize_spaces(text)
-    return " ".join("".join(ch for ch in text.lower() if ch.isalnum() or ch.isspace()).split())
-
-
-def _is_punct(ch: str) -> bool:
-    return unicodedata.category(ch).startswith("P")
+    return " ".join(text.lower().translate(_ALNUM_OR_SPACE).split())
 
 
 def _strip_accents(text: str) -> str:
-    return "".join(ch for ch in unicodedata.normalize("NFD", text) if unicodedata.category(ch) != "Mn")
+    return unicodedata.normalize("NFD", text).translate(_NO_MARKS)
 
 
 def _letters_only(text: str) -> str:
-    return "".join(ch for ch in text if ch.isalnum())
+    return text.translate(_ALNUM)
 
 
 def strict_match(given: str, expected: str) -> bool:
@@ -45,18 +71,47 @@ def list_unseen_cards(cards: Iterable[dict], progress: dict, *, direction: str,
         card_id = card.get("id")
         if not card_id:
             continue
-        if progress.get(card_id, {}).get(direction) is None:
+        if progress.get(card_id, EMPTY).get(direction) is None:
             unseen.append(card)
     return unseen
 
 
-def levenshtein(a: str, b: str) -> int:
+def _levenshtein_py(a: str, b: str) -> int:
     if a == b:
         return 0
     if not a:
         return len(b)
     if not b:
         return len(a)
+    if len(a) > 63:
+        return _levenshtein_dp(a, b)
+    peq: dict[str, int] = {}
+    bit = 1
+    for ch in a:
+        peq[ch] = peq.get(ch, 0) | bit
+        bit <<= 1
+    mask = bit - 1
+    high = bit >> 1
+    vp = mask
+    vn = 0
+    score = len(a)
+    for ch in b:
+        x = peq.get(ch, 0) | vn
+        d0 = (((x & vp) + vp) ^ vp) | x
+        hp = vn | ~(d0 | vp)
+        hn = d0 & vp
+        if hp & high:
+            score += 1
+        elif hn & high:
+            score -= 1
+        hp = (hp << 1) | 1
+        hn <<= 1
+        vp = (hn | ~(d0 | hp)) & mask
+        vn = hp & d0 & mask
+    return score
+
+
+def _levenshtein_dp(a: str, b: str) -> int:
     prev = list(range(len(b) + 1))
     for i, ca in enumerate(a, 1):
         cur = [i]
@@ -69,9 +124,31 @@ def levenshtein(a: str, b: str) -> int:
     return prev[-1]
 
 
+levenshtein = _rf_levenshtein.distance if _rf_levenshtein is not None else _levenshtein_py
+
+
+def prepare_expected(expected: str) -> dict:
+    norm = normalize_spaces(expected)
+    case = norm.casefold()
+    stripped = _strip_accents(case)
+    return {
+        "norm": norm,
+        "case": case,
+        "stripped": stripped,
+        "letters": _letters_only(stripped),
+        "punct": norm.translate(_PUNCT),
+        "word_count": sum(1 for w in norm.split(" ") if w),
+        "chars": frozenset(norm),
+    }
+
+
 def analyze_answer(given: str, expected: str) -> dict:
+    return analyze_prepared(given, prepare_expected(expected))
+
+
+def analyze_prepared(given: str, prepared: dict) -> dict:
     given_norm = normalize_spaces(given)
-    expected_norm = normalize_spaces(expected)
+    expected_norm = prepared["norm"]
     if not given_norm or not expected_norm:
         return {
             "correct": False,
@@ -86,15 +163,14 @@ def analyze_answer(given: str, expected: str) -> dict:
 
     correct = given_norm == expected_norm
     given_case = given_norm.casefold()
-    expected_case = expected_norm.casefold()
+    expected_case = prepared["case"]
     case_only = (given_case == expected_case) and not correct
 
-    given_letters = _letters_only(_strip_accents(given_case))
-    expected_letters = _letters_only(_strip_accents(expected_case))
-    letter_errors = levenshtein(given_letters, expected_letters)
+    given_stripped = _strip_accents(given_case)
+    letter_errors = levenshtein(_letters_only(given_stripped), prepared["letters"])
 
     accent_errors = 0
-    if _strip_accents(given_case) == _strip_accents(expected_case) and given_case != expected_case:
+    if given_stripped == prepared["stripped"] and given_case != expected_case:
         if len(given_case) == len(expected_case):
             for gch, ech in zip(given_case, expected_case):
                 if gch == ech:
@@ -102,15 +178,12 @@ def analyze_answer(given: str, expected: str) -> dict:
                 if _strip_accents(gch) == _strip_accents(ech) and gch.isalpha() and ech.isalpha():
                     accent_errors += 1
         else:
-            accent_errors = levenshtein(_strip_accents(given_case), given_case)
+            accent_errors = levenshtein(given_stripped, given_case)
 
-    given_punct = "".join(ch for ch in given_norm if _is_punct(ch))
-    expected_punct = "".join(ch for ch in expected_norm if _is_punct(ch))
-    punct_errors = levenshtein(given_punct, expected_punct)
+    given_punct = given_norm.translate(_PUNCT)
+    punct_errors = levenshtein(given_punct, prepared["punct"])
 
-    given_words = [w for w in given_norm.split(" ") if w]
-    expected_words = [w for w in expected_norm.split(" ") if w]
-    missing_word = len(given_words) < len(expected_words)
+    missing_word = sum(1 for w in given_norm.split(" ") if w) < prepared["word_count"]
 
     return {
         "correct": correct,
@@ -128,16 +201,28 @@ def evaluate_answer(given: str, expected: str) -> bool:
     return strict_match(given, expected)
 
 
-def shuffle_avoid_adjacent(items: list[dict], key: str, rng: random.Random | None = None,
-                           attempts: int = 200) -> list[dict]:
+def shuffle_avoid_adjacent(items: list[dict], key: str, rng: random.Random | None = None) -> list[dict]:
     if len(items) < 3:
         return items
     rng = rng or random
-    for _ in range(attempts):
-        rng.shuffle(items)
-        if all(items[i].get(key) != items[i - 1].get(key) for i in range(1, len(items))):
-            return items
-    return items
+    groups: dict = {}
+    for item in items:
+        groups.setdefault(item.get(key), []).append(item)
+    heap = [(-len(group), rng.random(), idx, group) for idx, group in enumerate(groups.values())]
+    heapq.heapify(heap)
+    result = []
+    prev = None
+    while heap:
+        entry = heapq.heappop(heap)
+        if entry[3] is prev and heap:
+            entry, held = heapq.heappop(heap), entry
+            heapq.heappush(heap, held)
+        count, _tie, idx, group = entry
+        result.append(group.pop())
+        prev = group
+        if count < -1:
+            heapq.heappush(heap, (count + 1, rng.random(), idx, group))
+    return result
 
 
 def parse_iso(ts: str) -> datetime | None:
@@ -205,7 +290,7 @@ def build_session_items(
             continue
         if card.get("lang", "en") != lang:
             continue
-        prog = progress.get(card_id, {}).get(direction)
+        prog = progress.get(card_id, EMPTY).get(direction)
         if mode == "introduce" and prog is not None:
             continue
         if mode == "review" and prog is None: